@@ -11,12 +11,203 @@ entity-relation tuples, providing:
 """
 
 import json
+import multiprocessing
+import sys
 import networkx as nx
 from pathlib import Path
-from typing import Dict, List, Any
+from xml.sax.saxutils import escape, quoteattr
+from typing import Dict, List, Any, Iterable, Iterator, Tuple
 from collections import defaultdict, Counter
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 import pickle
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Backslash and quote escaping for Cypher string literals, applied in one translate() pass
+_CYPHER_ESCAPE = str.maketrans({'\\': '\\\\', "'": "\\'", '"': '\\"'})
+
+# Rows per UNWIND statement in the Neo4j import script
+CYPHER_BATCH_SIZE = 500
+
+# GraphML attr.type for each Python attribute type (lists are written as CSV strings)
+_GRAPHML_TYPES = {bool: 'boolean', int: 'long', float: 'double', str: 'string'}
+
+
+def _seek_section(events: Iterator[Tuple], sections: set) -> Any:
+    """Advance the event stream past the opening of the next wanted section array"""
+    for prefix, event, _ in events:
+        if event == 'start_array' and prefix in sections:
+            return prefix
+    return None
+
+def _section_events(events: Iterator[Tuple], path: str) -> Iterator[Tuple]:
+    """Yield the events inside one section array, stopping at its end"""
+    for prefix, event, value in events:
+        if event == 'end_array' and prefix == path:
+            return
+        yield prefix, event, value
+
+def _parsed_sections(tuples_file: str, paths: List[str]) -> Iterator[Tuple[str, Iterable[Dict]]]:
+    """Yield (path, records) for each dotted section path from one full parse"""
+    with open(tuples_file, 'r') as f:
+        data = json.load(f)
+    for path in paths:
+        section = data
+        for key in path.split('.'):
+            section = section.get(key, {})
+        yield path, section or []
+
+def _read_sections(tuples_file: str, paths: List[str]) -> Iterator[Tuple[str, Iterable[Dict]]]:
+    """Yield (path, records) for each dotted section path of tuples.json.
+    
+    With ijson available the file is tokenized once and each section is
+    streamed record by record, so the whole document is never held in
+    memory; otherwise it is parsed once. Sections must be consumed in
+    order. A section missing from the file yields no records.
+    """
+    if ijson is None:
+        yield from _parsed_sections(tuples_file, paths)
+        return
+    
+    sections = set(paths)
+    with open(tuples_file, 'rb') as f:
+        events = ijson.parse(f, use_float=True)
+        entered = _seek_section(events, sections)
+        for i, path in enumerate(paths):
+            if entered != path:
+                # The file is not laid out in paths order (or lacks this
+                # section), so one pass cannot stream the rest; parse the
+                # file fully for the remaining sections
+                yield from _parsed_sections(tuples_file, paths[i:])
+                return
+            section = _section_events(events, path)
+            yield path, ijson.items(section, f'{path}.item')
+            # Skip whatever the caller left unread, then find the next section
+            for _ in section:
+                pass
+            entered = _seek_section(events, sections)
+
+def _write_json(obj: Any, output_path: str):
+    """Write obj as 2-space indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+def _graphml_keys(attr_dicts: Iterable[Dict]) -> Dict[str, str]:
+    """Collect attribute names and their GraphML types, falling back to string on conflicts"""
+    keys = {}
+    for data in attr_dicts:
+        for key, value in data.items():
+            attr_type = _GRAPHML_TYPES.get(type(value), 'string')
+            if keys.setdefault(key, attr_type) != attr_type:
+                keys[key] = 'string'
+    return keys
+
+@lru_cache(maxsize=4096)
+def _list_to_csv(values: tuple) -> str:
+    """Join list attribute values as CSV; memoized since domain lists repeat across nodes"""
+    return sys.intern(','.join(map(str, values)))
+
+def _graphml_data(data: Dict, key_ids: Dict[str, str]) -> str:
+    """Render an attribute dict as GraphML <data> elements"""
+    parts = []
+    for key, value in data.items():
+        if isinstance(value, list):
+            value = _list_to_csv(tuple(value))
+        text = escape(str(value))
+        if text:
+            parts.append(f'      <data key="{key_ids[key]}">{text}</data>\n')
+        else:
+            parts.append(f'      <data key="{key_ids[key]}" />\n')
+    return ''.join(parts)
+
+def _format_props(props: Dict[str, Any]) -> str:
+    """Format the non-empty properties of a node or edge as a Cypher map body"""
+    return ', '.join(f"{k}: '{v.translate(_CYPHER_ESCAPE)}'" if isinstance(v, str) else f"{k}: {v}"
+                     for k, v in props.items() if v)
+
+def _unwind_statements(rows: List[str], alias: str, body: str, batch_size: int) -> Iterator[str]:
+    """Yield UNWIND statements applying body to batches of Cypher map literals"""
+    for i in range(0, len(rows), batch_size):
+        batch = ',\n  '.join(rows[i:i + batch_size])
+        yield f"UNWIND [\n  {batch}\n] AS {alias}\n{body};\n\n"
+
+def _principle_nodes(principles: Iterable[Dict]) -> List[Tuple[str, Dict]]:
+    """Build (node_id, attrs) tuples for Level 1 principle nodes"""
+    return [
+        (p['node_id'], {
+            'node_type': 'principle',
+            'level': 1,
+            'name': p.get('name', ''),
+            'description': p.get('description', ''),
+            'domains': p.get('domains', []),
+            'confidence': p.get('confidence', 1.0),
+            'provenance': p.get('provenance', ''),
+            'inference_type': p.get('inference_type', ''),
+            'application_context': p.get('application_context', '')
+        })
+        for p in principles
+    ]
+
+def _rule_nodes(rules: Iterable[Dict]) -> List[Tuple[str, Dict]]:
+    """Build (node_id, attrs) tuples for Level 2+ rule nodes"""
+    return [
+        (r['node_id'], {
+            'node_type': 'rule',
+            'level': r.get('level', 2),
+            'name': r.get('name', ''),
+            'description': r.get('description', ''),
+            'jurisdiction': r.get('jurisdiction', ''),
+            'legal_domain': r.get('legal_domain', ''),
+            'confidence': r.get('confidence', 0.95),
+            'derived_from': r.get('derived_from', []),
+            'inference_type': r.get('inference_type', 'deductive')
+        })
+        for r in rules
+    ]
+
+def _concept_nodes(concepts: Iterable[Dict]) -> List[Tuple[str, Dict]]:
+    """Build (node_id, attrs) tuples for concept nodes"""
+    return [
+        (c['node_id'], {
+            'node_type': 'concept',
+            'name': c.get('name', ''),
+            'description': c.get('description', ''),
+            'domains': c.get('domains', [])
+        })
+        for c in concepts
+    ]
+
+def _domain_nodes(domains: Iterable[Dict]) -> List[Tuple[str, Dict]]:
+    """Build (node_id, attrs) tuples for domain nodes"""
+    return [(d['node_id'], {'node_type': 'domain', 'name': d.get('name', '')}) for d in domains]
+
+def _note_names(records: Iterable[Dict], has_name: List[bool]) -> Iterator[Dict]:
+    """Pass records through, appending whether each one has a 'name' key to has_name"""
+    for record in records:
+        has_name.append('name' in record)
+        yield record
+
+# Node builders keyed by their section under tuples.json's "nodes" object, in load order
+_NODE_HANDLERS = {
+    'principles': _principle_nodes,
+    'rules': _rule_nodes,
+    'concepts': _concept_nodes,
+    'domains': _domain_nodes
+}
+
 class SCMLexHypergraph:
     """Universal hypergraph for legal reasoning"""
     
@@ -26,195 +217,199 @@ class SCMLexHypergraph:
         self.node_index = {}  # Map node names to IDs
         self.stats = {}
         
-    def load_from_tuples(self, tuples_file: str):
-        """Load graph from extracted tuples JSON"""
+        # Columnar edge table staged during construction, then bulk-inserted
+        self._edge_src: List[str] = []
+        self._edge_dst: List[str] = []
+        self._edge_type: List[str] = []
+        self._edge_attrs: List[Dict] = []
+        self._edge_type_counts = Counter()
+        
+    def load_from_tuples(self, tuples_file: str, compute_connectivity: bool = False):
+        """Load graph from extracted tuples JSON
+        
+        Weak connectivity is an O(N+E) traversal, so it is only computed
+        when compute_connectivity is set; otherwise it is reported as None.
+        """
         print(f"Loading tuples from {tuples_file}...")
         
-        with open(tuples_file, 'r') as f:
-            data = json.load(f)
+        sections = _read_sections(
+            tuples_file,
+            [f'nodes.{kind}' for kind in _NODE_HANDLERS]
+            + ['hyperedges.relationships', 'hyperedges.derivations']
+        )
         
-        # Add nodes
-        self._add_principles(data['nodes']['principles'])
-        self._add_rules(data['nodes']['rules'])
-        self._add_concepts(data['nodes']['concepts'])
-        self._add_domains(data['nodes']['domains'])
+        # Add nodes: dispatch each section to its builder, then insert everything at once.
+        # _NODE_HANDLERS comes first in zip() so the hyperedge sections are not consumed here.
+        nodes = []
+        has_name = []  # whether each record carried a 'name' key, in node order
+        counts = []
+        for (kind, build), (_, records) in zip(_NODE_HANDLERS.items(), sections):
+            built = build(_note_names(records, has_name))
+            # Intern IDs and names so the graph, node_index and edge endpoints share one
+            # string object per node and key comparisons short-circuit on identity
+            for i, (node_id, attrs) in enumerate(built):
+                if isinstance(attrs['name'], str):
+                    attrs['name'] = sys.intern(attrs['name'])
+                built[i] = (sys.intern(node_id), attrs)
+            nodes.extend(built)
+            if built:
+                counts.append(f"{len(built)} {kind}")
+        print(f"Adding {', '.join(counts)}...")
+        self.graph.add_nodes_from(nodes)
+        # Index by name for easy lookup; every record that has a name key is indexed,
+        # even when the name is empty or null
+        self.node_index.update({attrs['name']: node_id
+                                for (node_id, attrs), named in zip(nodes, has_name) if named})
         
         # Add hyperedges
-        self._add_relationships(data['hyperedges']['relationships'])
-        self._add_derivations(data['hyperedges']['derivations'])
+        self._add_relationships(next(sections)[1])
+        self._add_derivations(next(sections)[1])
+        self._materialize_edges()
         
         # Compute statistics
-        self._compute_statistics()
+        self._compute_statistics(compute_connectivity)
         
         print(f"\n✅ Hypergraph constructed:")
         print(f"   Nodes: {self.graph.number_of_nodes()}")
         print(f"   Edges: {self.graph.number_of_edges()}")
         print(f"   Hyperedges: {len(self.hyperedges)}")
     
-    def _add_principles(self, principles: List[Dict]):
-        """Add Level 1 principle nodes"""
-        print(f"Adding {len(principles)} principles...")
-        for p in principles:
-            node_id = p['node_id']
-            self.graph.add_node(
-                node_id,
-                node_type='principle',
-                level=1,
-                name=p.get('name', ''),
-                description=p.get('description', ''),
-                domains=p.get('domains', []),
-                confidence=p.get('confidence', 1.0),
-                provenance=p.get('provenance', ''),
-                inference_type=p.get('inference_type', ''),
-                application_context=p.get('application_context', '')
-            )
-            # Index by name for easy lookup
-            if 'name' in p:
-                self.node_index[p['name']] = node_id
-    
-    def _add_rules(self, rules: List[Dict]):
-        """Add Level 2+ rule nodes"""
-        print(f"Adding {len(rules)} rules...")
-        for r in rules:
-            node_id = r['node_id']
-            self.graph.add_node(
-                node_id,
-                node_type='rule',
-                level=r.get('level', 2),
-                name=r.get('name', ''),
-                description=r.get('description', ''),
-                jurisdiction=r.get('jurisdiction', ''),
-                legal_domain=r.get('legal_domain', ''),
-                confidence=r.get('confidence', 0.95),
-                derived_from=r.get('derived_from', []),
-                inference_type=r.get('inference_type', 'deductive')
-            )
-            if 'name' in r:
-                self.node_index[r['name']] = node_id
-    
-    def _add_concepts(self, concepts: List[Dict]):
-        """Add concept nodes"""
-        if concepts:
-            print(f"Adding {len(concepts)} concepts...")
-            for c in concepts:
-                node_id = c['node_id']
-                self.graph.add_node(
-                    node_id,
-                    node_type='concept',
-                    name=c.get('name', ''),
-                    description=c.get('description', ''),
-                    domains=c.get('domains', [])
-                )
-                if 'name' in c:
-                    self.node_index[c['name']] = node_id
-    
-    def _add_domains(self, domains: List[Dict]):
-        """Add domain nodes"""
-        print(f"Adding {len(domains)} domains...")
-        for d in domains:
-            node_id = d['node_id']
-            self.graph.add_node(
-                node_id,
-                node_type='domain',
-                name=d.get('name', '')
-            )
-            if 'name' in d:
-                self.node_index[d['name']] = node_id
-    
-    def _add_relationships(self, relationships: List[Dict]):
+    def _add_relationships(self, relationships: Iterable[Dict]):
         """Add relationship edges between principles"""
-        print(f"Adding {len(relationships)} relationships...")
-        for rel in relationships:
+        # Nodes are all in place before edges, so snapshot their IDs for O(1) membership
+        node_ids = set(self.graph.nodes())
+        # Bound lookup with KeyError fall-through: one probe for indexed names
+        resolve = self.node_index.__getitem__
+        count = 0
+        for count, rel in enumerate(relationships, 1):
             source = rel['source_node']
             # Handle both single target and multiple targets
             targets = rel.get('target_nodes', [rel.get('target_node')])
             if not isinstance(targets, list):
                 targets = [targets]
             
+            # Resolve names to IDs if needed
+            try:
+                source_id = resolve(source)
+            except KeyError:
+                source_id = source
+            
             for target in targets:
-                # Resolve names to IDs if needed
-                source_id = self.node_index.get(source, source)
-                target_id = self.node_index.get(target, target)
+                try:
+                    target_id = resolve(target)
+                except KeyError:
+                    target_id = target
                 
-                if self.graph.has_node(source_id) and self.graph.has_node(target_id):
-                    self.graph.add_edge(
-                        source_id,
-                        target_id,
-                        edge_type='relationship',
-                        relationship_name=rel.get('relationship_name', 'related-to'),
-                        strength=rel.get('strength', 0.9),
-                        hyperedge_id=rel.get('hyperedge_id', '')
-                    )
+                if source_id in node_ids and target_id in node_ids:
+                    self._stage_edge(source_id, target_id, {
+                        'edge_type': 'relationship',
+                        'relationship_name': rel.get('relationship_name', 'related-to'),
+                        'strength': rel.get('strength', 0.9),
+                        'hyperedge_id': rel.get('hyperedge_id', '')
+                    })
             
             # Store as hyperedge if multiple targets
             if len(targets) > 1:
                 self.hyperedges.append(rel)
+        
+        print(f"Adding {count} relationships...")
     
-    def _add_derivations(self, derivations: List[Dict]):
+    def _add_derivations(self, derivations: Iterable[Dict]):
         """Add derivation edges from principles to rules"""
-        print(f"Adding {len(derivations)} derivations...")
-        for deriv in derivations:
+        node_ids = set(self.graph.nodes())
+        resolve = self.node_index.__getitem__
+        count = 0
+        for count, deriv in enumerate(derivations, 1):
             source_nodes = deriv.get('source_nodes', [])
             target_node = deriv.get('target_node', '')
             
             # Add edges from each source principle to the target rule
             for source in source_nodes:
-                source_id = self.node_index.get(source, source)
+                try:
+                    source_id = resolve(source)
+                except KeyError:
+                    source_id = source
                 target_id = target_node
                 
-                if self.graph.has_node(source_id) and self.graph.has_node(target_id):
-                    self.graph.add_edge(
-                        source_id,
-                        target_id,
-                        edge_type='derivation',
-                        inference_type=deriv.get('inference_type', 'deductive'),
-                        confidence_impact=deriv.get('confidence_impact', 0.95),
-                        hyperedge_id=deriv.get('hyperedge_id', ''),
-                        description=deriv.get('description', '')
-                    )
+                if source_id in node_ids and target_id in node_ids:
+                    self._stage_edge(source_id, target_id, {
+                        'edge_type': 'derivation',
+                        'inference_type': deriv.get('inference_type', 'deductive'),
+                        'confidence_impact': deriv.get('confidence_impact', 0.95),
+                        'hyperedge_id': deriv.get('hyperedge_id', ''),
+                        'description': deriv.get('description', '')
+                    })
             
             # Store as hyperedge
             self.hyperedges.append(deriv)
+        
+        print(f"Adding {count} derivations...")
     
-    def _compute_statistics(self):
+    def _stage_edge(self, source_id: str, target_id: str, attrs: Dict):
+        """Append one edge to the columnar edge table"""
+        self._edge_src.append(sys.intern(source_id))
+        self._edge_dst.append(sys.intern(target_id))
+        self._edge_type.append(attrs['edge_type'])
+        self._edge_attrs.append(attrs)
+    
+    def _materialize_edges(self):
+        """Insert every staged edge into the graph in one bulk call"""
+        self.graph.add_edges_from(zip(self._edge_src, self._edge_dst, self._edge_attrs))
+        self._edge_type_counts.update(self._edge_type)
+        
+        # The graph now owns the edges; drop the staging columns so the attribute
+        # dicts are not kept alive (or pickled into export workers) a second time
+        self._edge_src.clear()
+        self._edge_dst.clear()
+        self._edge_type.clear()
+        self._edge_attrs.clear()
+    
+    def _compute_statistics(self, compute_connectivity: bool = False):
         """Compute graph statistics"""
         print("\nComputing graph statistics...")
         
-        # Node statistics
-        node_types = Counter(nx.get_node_attributes(self.graph, 'node_type').values())
-        
-        # Edge statistics
-        edge_types = Counter(nx.get_edge_attributes(self.graph, 'edge_type').values())
-        
-        # Domain statistics
-        domains = []
+        # Node, level and domain statistics in a single pass over the nodes
+        node_types = Counter()
+        levels = Counter()
+        domain_counts = Counter()
         for node, data in self.graph.nodes(data=True):
+            if 'node_type' in data:
+                node_types[data['node_type']] += 1
+            if 'level' in data:
+                levels[data['level']] += 1
             if 'domains' in data:
-                domains.extend(data['domains'])
+                domain_counts.update(data['domains'])
             elif 'legal_domain' in data:
-                domains.append(data['legal_domain'])
-        domain_counts = Counter(domains)
+                domain_counts[data['legal_domain']] += 1
+        
+        # Edge statistics (tallied from the edge table's type column when it was materialized)
+        edge_types = Counter(self._edge_type_counts)
         
-        # Level statistics
-        levels = Counter(nx.get_node_attributes(self.graph, 'level').values())
+        # Connectivity statistics: every edge adds one to an in- and an out-degree
+        num_nodes = self.graph.number_of_nodes()
+        num_edges = self.graph.number_of_edges()
+        avg_degree = 2 * num_edges / num_nodes if num_nodes > 0 else 0
+        density = num_edges / (num_nodes * (num_nodes - 1)) if num_nodes > 1 else 0
         
-        # Connectivity statistics
-        if self.graph.number_of_nodes() > 0:
-            avg_degree = sum(dict(self.graph.degree()).values()) / self.graph.number_of_nodes()
+        # Weak connectivity needs a full O(N+E) traversal, so it is opt-in
+        if num_nodes == 0:
+            is_connected = False
+        elif compute_connectivity:
+            is_connected = nx.is_weakly_connected(self.graph)
         else:
-            avg_degree = 0
+            is_connected = None
         
         self.stats = {
-            'total_nodes': self.graph.number_of_nodes(),
-            'total_edges': self.graph.number_of_edges(),
+            'total_nodes': num_nodes,
+            'total_edges': num_edges,
             'total_hyperedges': len(self.hyperedges),
             'node_types': dict(node_types),
             'edge_types': dict(edge_types),
             'levels': dict(levels),
             'top_domains': dict(domain_counts.most_common(10)),
             'average_degree': round(avg_degree, 2),
-            'density': round(nx.density(self.graph), 6),
-            'is_connected': nx.is_weakly_connected(self.graph) if self.graph.number_of_nodes() > 0 else False
+            'density': round(density, 6),
+            'is_connected': is_connected
         }
         
         # Print statistics
@@ -245,17 +440,32 @@ class SCMLexHypergraph:
     def export_graphml(self, output_path: str):
         """Export to GraphML format (for Gephi, Cytoscape)"""
         print(f"\nExporting to GraphML: {output_path}")
-        # Create a copy and convert list attributes to strings for GraphML compatibility
-        graph_copy = self.graph.copy()
-        for node, data in graph_copy.nodes(data=True):
-            for key, value in list(data.items()):
-                if isinstance(value, list):
-                    data[key] = ','.join(str(v) for v in value)
-        for u, v, key, data in graph_copy.edges(keys=True, data=True):
-            for attr, value in list(data.items()):
-                if isinstance(value, list):
-                    data[attr] = ','.join(str(val) for val in value)
-        nx.write_graphml(graph_copy, output_path)
+        # Stream the XML directly from the graph; list attributes are written as
+        # comma-separated strings for GraphML compatibility, so no copy is needed
+        node_keys = _graphml_keys(data for _, data in self.graph.nodes(data=True))
+        edge_keys = _graphml_keys(data for _, _, data in self.graph.edges(data=True))
+        node_ids = {name: f"d{i}" for i, name in enumerate(node_keys)}
+        edge_ids = {name: f"d{i}" for i, name in enumerate(edge_keys, len(node_keys))}
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write("<?xml version='1.0' encoding='utf-8'?>\n")
+            f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" '
+                    'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+                    'xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns '
+                    'http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
+            for domain, keys, ids in (('node', node_keys, node_ids), ('edge', edge_keys, edge_ids)):
+                for name, attr_type in keys.items():
+                    f.write(f'  <key id="{ids[name]}" for="{domain}" '
+                            f'attr.name={quoteattr(name)} attr.type="{attr_type}" />\n')
+            f.write('  <graph edgedefault="directed">\n')
+            
+            for node, data in self.graph.nodes(data=True):
+                f.write(f'    <node id={quoteattr(str(node))}>\n{_graphml_data(data, node_ids)}    </node>\n')
+            for u, v, key, data in self.graph.edges(keys=True, data=True):
+                f.write(f'    <edge source={quoteattr(str(u))} target={quoteattr(str(v))} id={quoteattr(str(key))}>\n'
+                        f'{_graphml_data(data, edge_ids)}    </edge>\n')
+            
+            f.write('  </graph>\n</graphml>\n')
         print(f"✅ GraphML exported")
     
     def export_json(self, output_path: str):
@@ -265,8 +475,7 @@ class SCMLexHypergraph:
         data['hyperedges'] = self.hyperedges
         data['statistics'] = self.stats
         
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json(data, output_path)
         print(f"✅ JSON exported")
     
     def export_pickle(self, output_path: str):
@@ -278,13 +487,57 @@ class SCMLexHypergraph:
                 'hyperedges': self.hyperedges,
                 'node_index': self.node_index,
                 'stats': self.stats
-            }, f)
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
         print(f"✅ Pickle exported")
     
-    def export_neo4j_cypher(self, output_path: str):
-        """Export to Neo4j Cypher statements"""
+    def export_neo4j_cypher(self, output_path: str, batch_size: int = CYPHER_BATCH_SIZE):
+        """Export to Neo4j Cypher statements (batched UNWIND per label/relationship type)"""
         print(f"\nExporting to Neo4j Cypher: {output_path}")
         
+        # Group node rows by label so each batch is a single CREATE over UNWIND
+        node_rows = defaultdict(list)
+        node_labels = {}
+        for node_id, data in self.graph.nodes(data=True):
+            node_type = data.get('node_type', 'Unknown')
+            label = node_type.capitalize()
+            node_labels[node_id] = label
+            
+            props = {
+                'id': node_id,
+                'name': data.get('name', ''),
+                'description': data.get('description', '')
+            }
+            
+            # Add type-specific properties
+            if node_type == 'principle':
+                props.update({
+                    'level': data.get('level', 1),
+                    'confidence': data.get('confidence', 1.0),
+                    'provenance': data.get('provenance', ''),
+                    'inference_type': data.get('inference_type', '')
+                })
+            elif node_type == 'rule':
+                props.update({
+                    'level': data.get('level', 2),
+                    'jurisdiction': data.get('jurisdiction', ''),
+                    'legal_domain': data.get('legal_domain', ''),
+                    'confidence': data.get('confidence', 0.95)
+                })
+            
+            node_rows[label].append(f"{{{_format_props(props)}}}")
+        
+        # Group edge rows by relationship type and endpoint labels so MATCH can use the id constraints
+        edge_rows = defaultdict(list)
+        for source, target, data in self.graph.edges(data=True):
+            edge_type = data.get('edge_type', 'RELATES_TO').upper()
+            props = {k: v for k, v in data.items() if k != 'edge_type'}
+            key = (edge_type, node_labels[source], node_labels[target])
+            src = str(source).translate(_CYPHER_ESCAPE)
+            dst = str(target).translate(_CYPHER_ESCAPE)
+            edge_rows[key].append(
+                f"{{src: '{src}', dst: '{dst}', props: {{{_format_props(props)}}}}}"
+            )
+        
         with open(output_path, 'w') as f:
             # Write header
             f.write("// SCMLex Hypergraph - Neo4j Import Script\n")
@@ -298,52 +551,38 @@ class SCMLexHypergraph:
             
             # Create nodes
             f.write("// Create nodes\n")
-            for node_id, data in self.graph.nodes(data=True):
-                node_type = data.get('node_type', 'Unknown')
-                label = node_type.capitalize()
-                
-                props = {
-                    'id': node_id,
-                    'name': data.get('name', ''),
-                    'description': data.get('description', '').replace("'", "\\'").replace('"', '\\"')
-                }
-                
-                # Add type-specific properties
-                if node_type == 'principle':
-                    props.update({
-                        'level': data.get('level', 1),
-                        'confidence': data.get('confidence', 1.0),
-                        'provenance': data.get('provenance', ''),
-                        'inference_type': data.get('inference_type', '')
-                    })
-                elif node_type == 'rule':
-                    props.update({
-                        'level': data.get('level', 2),
-                        'jurisdiction': data.get('jurisdiction', ''),
-                        'legal_domain': data.get('legal_domain', ''),
-                        'confidence': data.get('confidence', 0.95)
-                    })
-                
-                # Format properties
-                props_str = ', '.join([f"{k}: '{v}'" if isinstance(v, str) else f"{k}: {v}" 
-                                      for k, v in props.items() if v])
-                
-                f.write(f"CREATE (:{label} {{{props_str}}});\n")
+            for label, rows in node_rows.items():
+                f.writelines(_unwind_statements(
+                    rows, 'row', f"CREATE (n:{label}) SET n = row", batch_size))
             
-            f.write("\n// Create relationships\n")
-            for source, target, data in self.graph.edges(data=True):
-                edge_type = data.get('edge_type', 'RELATES_TO').upper()
-                props = {k: v for k, v in data.items() if k != 'edge_type' and v}
-                props_str = ', '.join([f"{k}: '{v}'" if isinstance(v, str) else f"{k}: {v}" 
-                                      for k, v in props.items()])
-                
-                f.write(f"MATCH (a {{id: '{source}'}}), (b {{id: '{target}'}}) ")
-                f.write(f"CREATE (a)-[:{edge_type} {{{props_str}}}]->(b);\n")
+            f.write("// Create relationships\n")
+            for (edge_type, source_label, target_label), rows in edge_rows.items():
+                f.writelines(_unwind_statements(
+                    rows, 'e',
+                    f"MATCH (a:{source_label} {{id: e.src}}), (b:{target_label} {{id: e.dst}})\n"
+                    f"CREATE (a)-[r:{edge_type}]->(b) SET r = e.props",
+                    batch_size))
         
         print(f"✅ Neo4j Cypher exported")
 
+# (export method, output file) for each format written by main()
+EXPORTS = [
+    ('export_graphml', 'scmlex_hypergraph.graphml'),
+    ('export_json', 'scmlex_hypergraph.json'),
+    ('export_pickle', 'scmlex_hypergraph.pkl'),
+    ('export_neo4j_cypher', 'scmlex_hypergraph_neo4j.cypher'),
+]
+
+# The hypergraph being exported, inherited by forked export workers
+_export_source = None
+
+def _run_export(method: str, output_path: str):
+    """Run one export method of the inherited hypergraph in a worker"""
+    getattr(_export_source, method)(output_path)
+
 def main():
     """Main execution"""
+    global _export_source
     import sys
     
     tuples_file = sys.argv[1] if len(sys.argv) > 1 else "/home/ubuntu/chainlex/hypergraph/tuples.json"
@@ -351,17 +590,28 @@ def main():
     
     # Build hypergraph
     hypergraph = SCMLexHypergraph()
-    hypergraph.load_from_tuples(tuples_file)
+    # The published statistics report connectivity, so pay for the traversal here
+    hypergraph.load_from_tuples(tuples_file, compute_connectivity=True)
     
-    # Export to multiple formats
-    hypergraph.export_graphml(str(output_dir / "scmlex_hypergraph.graphml"))
-    hypergraph.export_json(str(output_dir / "scmlex_hypergraph.json"))
-    hypergraph.export_pickle(str(output_dir / "scmlex_hypergraph.pkl"))
-    hypergraph.export_neo4j_cypher(str(output_dir / "scmlex_hypergraph_neo4j.cypher"))
+    # Export to multiple formats; the writers are independent, so run them
+    # in separate processes to keep the CPU-bound serializers off one GIL.
+    # Every writer needs the whole graph, so forked workers inherit it from
+    # this process rather than having it pickled into each task.
+    if 'fork' in multiprocessing.get_all_start_methods():
+        _export_source = hypergraph
+        with ProcessPoolExecutor(max_workers=len(EXPORTS),
+                                 mp_context=multiprocessing.get_context('fork')) as executor:
+            futures = [executor.submit(_run_export, method, str(output_dir / filename))
+                       for method, filename in EXPORTS]
+            for future in futures:
+                future.result()
+        _export_source = None
+    else:
+        for method, filename in EXPORTS:
+            getattr(hypergraph, method)(str(output_dir / filename))
     
     # Save statistics
-    with open(output_dir / "hypergraph_stats.json", 'w') as f:
-        json.dump(hypergraph.stats, f, indent=2)
+    _write_json(hypergraph.stats, str(output_dir / "hypergraph_stats.json"))
     
     print("\n✅ Hypergraph construction complete!")
     print(f"   Output directory: {output_dir}")
@@ -133,3 +133,20 @@ JOIN scmlex_nodes r ON e2.target_node_id = r.node_id
 WHERE p.node_type = 'principle'
     AND r.node_type = 'rule'
 LIMIT 10;
+
+-- 16. Substring and fuzzy name lookups (served by the trigram indexes)
+SELECT node_type, name
+FROM scmlex_nodes
+WHERE name ILIKE '%contract%';
+
+SELECT name, similarity(name, 'pakta-sunt-servanda') as score
+FROM scmlex_nodes
+WHERE name % 'pakta-sunt-servanda'
+ORDER BY score DESC
+LIMIT 10;
+
+-- 17. Derivations whose rule mentions "contract" (filters on the stored search_vec)
+SELECT principle_name, rule_name, jurisdiction, legal_domain
+FROM v_principle_rule_derivations
+WHERE rule_search_vec @@ plainto_tsquery('english', 'contract')
+LIMIT 10;
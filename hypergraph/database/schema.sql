@@ -1,18 +1,29 @@
 
--- SCMLex Hypergraph Database Schema
+-- SCMLex Hypergraph Database Schema: Pre-Load
 -- Version: 1.0
 -- Date: 2025-10-23
+--
+-- Tables, partitions, primary keys and the search_vec trigger only. Bulk load
+-- the data, then run the post-load script to build indexes, views and
+-- functions.
 
--- Enable UUID extension
-CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+-- Enable trigram matching for substring and fuzzy name lookups
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Enable case-insensitive text for jurisdiction and domain codes
+CREATE EXTENSION IF NOT EXISTS citext;
 
 -- ============================================================================
--- NODES TABLE
+-- NODES TABLE (list-partitioned by node_type)
 -- ============================================================================
 
+-- Every view and query filters on node_type, so each one is pruned to a single
+-- partition. Unique keys on a partitioned table must include the partition key,
+-- hence (id, node_type) and (node_id, node_type). BIGSERIAL rather than an
+-- identity column, which partitioned tables only accept from PostgreSQL 17.
 CREATE TABLE IF NOT EXISTS scmlex_nodes (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-    node_id TEXT UNIQUE NOT NULL,
+    id BIGSERIAL,
+    node_id TEXT NOT NULL,
     node_type TEXT NOT NULL CHECK (node_type IN ('principle', 'rule', 'concept', 'domain')),
     level INTEGER,
     name TEXT NOT NULL,
@@ -22,9 +33,9 @@ CREATE TABLE IF NOT EXISTS scmlex_nodes (
     provenance TEXT,
     application_context TEXT,
     
-    -- Rule-specific fields
-    jurisdiction TEXT,
-    legal_domain TEXT,
+    -- Rule-specific fields (CITEXT: 'za' and 'ZA' compare equal and share the btree)
+    jurisdiction CITEXT,
+    legal_domain CITEXT,
     
     -- Common fields
     confidence DECIMAL(3,2) DEFAULT 1.0,
@@ -34,33 +45,82 @@ CREATE TABLE IF NOT EXISTS scmlex_nodes (
     domains TEXT[],
     derived_from TEXT[],
     
+    -- Full-text search document, maintained by scmlex_nodes_tsv_trigger
+    search_vec TSVECTOR,
+    
     -- Metadata
     created_at TIMESTAMP DEFAULT NOW(),
-    updated_at TIMESTAMP DEFAULT NOW()
+    updated_at TIMESTAMP DEFAULT NOW(),
+    
+    PRIMARY KEY (id, node_type),
+    UNIQUE (node_id, node_type)
+) PARTITION BY LIST (node_type);
+
+CREATE TABLE IF NOT EXISTS scmlex_nodes_principle PARTITION OF scmlex_nodes FOR VALUES IN ('principle');
+CREATE TABLE IF NOT EXISTS scmlex_nodes_rule PARTITION OF scmlex_nodes FOR VALUES IN ('rule');
+CREATE TABLE IF NOT EXISTS scmlex_nodes_concept PARTITION OF scmlex_nodes FOR VALUES IN ('concept');
+CREATE TABLE IF NOT EXISTS scmlex_nodes_domain PARTITION OF scmlex_nodes FOR VALUES IN ('domain');
+
+-- Keep search_vec in sync on every write, including rows arriving through COPY
+CREATE OR REPLACE FUNCTION scmlex_nodes_tsv_trigger() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vec := to_tsvector('english', COALESCE(NEW.name, '') || ' ' || COALESCE(NEW.description, ''));
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS tsvupdate ON scmlex_nodes;
+CREATE TRIGGER tsvupdate BEFORE INSERT OR UPDATE ON scmlex_nodes
+    FOR EACH ROW EXECUTE FUNCTION scmlex_nodes_tsv_trigger();
+
+-- The partitioned table can only enforce (node_id, node_type), but edges, views
+-- and functions join on node_id alone. Each node_id claims a row here, so the
+-- same id can never be loaded under two node types.
+CREATE TABLE IF NOT EXISTS scmlex_node_ids (
+    node_id TEXT PRIMARY KEY,
+    node_type TEXT NOT NULL
 );
 
--- Indexes for efficient queries
-CREATE INDEX IF NOT EXISTS idx_nodes_type ON scmlex_nodes(node_type);
-CREATE INDEX IF NOT EXISTS idx_nodes_level ON scmlex_nodes(level);
-CREATE INDEX IF NOT EXISTS idx_nodes_name ON scmlex_nodes(name);
-CREATE INDEX IF NOT EXISTS idx_nodes_jurisdiction ON scmlex_nodes(jurisdiction);
-CREATE INDEX IF NOT EXISTS idx_nodes_legal_domain ON scmlex_nodes(legal_domain);
-CREATE INDEX IF NOT EXISTS idx_nodes_domains ON scmlex_nodes USING GIN(domains);
+-- Claim ids that predate the guard
+INSERT INTO scmlex_node_ids (node_id, node_type)
+SELECT node_id, node_type FROM scmlex_nodes
+ON CONFLICT (node_id) DO NOTHING;
 
--- Full-text search index
-CREATE INDEX IF NOT EXISTS idx_nodes_search ON scmlex_nodes 
-    USING GIN(to_tsvector('english', name || ' ' || COALESCE(description, '')));
+CREATE OR REPLACE FUNCTION scmlex_node_ids_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        DELETE FROM scmlex_node_ids WHERE node_id = OLD.node_id AND node_type = OLD.node_type;
+    END IF;
+    IF TG_OP = 'DELETE' THEN
+        RETURN OLD;
+    END IF;
+    
+    -- Re-inserting an id under its own type (a re-run load) is not a conflict
+    INSERT INTO scmlex_node_ids (node_id, node_type) VALUES (NEW.node_id, NEW.node_type)
+        ON CONFLICT (node_id) DO NOTHING;
+    IF NOT FOUND AND NOT EXISTS (SELECT 1 FROM scmlex_node_ids
+                                 WHERE node_id = NEW.node_id AND node_type = NEW.node_type) THEN
+        RAISE EXCEPTION 'node_id % already exists under another node_type', NEW.node_id
+            USING ERRCODE = 'unique_violation';
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS node_id_unique ON scmlex_nodes;
+CREATE TRIGGER node_id_unique BEFORE INSERT OR UPDATE OF node_id, node_type OR DELETE ON scmlex_nodes
+    FOR EACH ROW EXECUTE FUNCTION scmlex_node_ids_trigger();
 
 -- ============================================================================
 -- EDGES TABLE
 -- ============================================================================
 
 CREATE TABLE IF NOT EXISTS scmlex_edges (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
     edge_id TEXT UNIQUE,
     edge_type TEXT NOT NULL CHECK (edge_type IN ('relationship', 'derivation', 'domain_membership')),
-    source_node_id TEXT NOT NULL REFERENCES scmlex_nodes(node_id),
-    target_node_id TEXT NOT NULL REFERENCES scmlex_nodes(node_id),
+    source_node_id TEXT NOT NULL,
+    target_node_id TEXT NOT NULL,
     
     -- Edge attributes
     relationship_name TEXT,
@@ -70,24 +130,15 @@ CREATE TABLE IF NOT EXISTS scmlex_edges (
     description TEXT,
     
     -- Metadata
-    created_at TIMESTAMP DEFAULT NOW(),
-    
-    CONSTRAINT fk_source FOREIGN KEY (source_node_id) REFERENCES scmlex_nodes(node_id),
-    CONSTRAINT fk_target FOREIGN KEY (target_node_id) REFERENCES scmlex_nodes(node_id)
+    created_at TIMESTAMP DEFAULT NOW()
 );
 
--- Indexes for efficient queries
-CREATE INDEX IF NOT EXISTS idx_edges_type ON scmlex_edges(edge_type);
-CREATE INDEX IF NOT EXISTS idx_edges_source ON scmlex_edges(source_node_id);
-CREATE INDEX IF NOT EXISTS idx_edges_target ON scmlex_edges(target_node_id);
-CREATE INDEX IF NOT EXISTS idx_edges_source_target ON scmlex_edges(source_node_id, target_node_id);
-
 -- ============================================================================
 -- HYPEREDGES TABLE (for edges connecting multiple nodes)
 -- ============================================================================
 
 CREATE TABLE IF NOT EXISTS scmlex_hyperedges (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
     hyperedge_id TEXT UNIQUE NOT NULL,
     hyperedge_type TEXT NOT NULL,
     source_nodes TEXT[] NOT NULL,
@@ -105,9 +156,70 @@ CREATE TABLE IF NOT EXISTS scmlex_hyperedges (
     created_at TIMESTAMP DEFAULT NOW()
 );
 
+
+-- SCMLex Hypergraph Database Schema: Post-Load
+-- Version: 1.0
+-- Date: 2025-10-23
+--
+-- Run after the bulk load so every index is built in one pass over the
+-- loaded tables.
+
+-- ============================================================================
+-- NODE INDEXES
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_nodes_level ON scmlex_nodes(level);
+CREATE INDEX IF NOT EXISTS idx_nodes_name ON scmlex_nodes(name);
+CREATE INDEX IF NOT EXISTS idx_nodes_name_trgm ON scmlex_nodes USING GIN(name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_nodes_desc_trgm ON scmlex_nodes USING GIN(description gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_nodes_jurisdiction ON scmlex_nodes(jurisdiction);
+CREATE INDEX IF NOT EXISTS idx_nodes_legal_domain ON scmlex_nodes(legal_domain);
+CREATE INDEX IF NOT EXISTS idx_nodes_domains ON scmlex_nodes USING GIN(domains);
+
+-- Composite and covering indexes matching the view and sample query filters
+CREATE INDEX IF NOT EXISTS idx_nodes_type_level ON scmlex_nodes(node_type, level) INCLUDE (name, confidence);
+CREATE INDEX IF NOT EXISTS idx_nodes_type_jur_dom ON scmlex_nodes(node_type, jurisdiction, legal_domain);
+CREATE INDEX IF NOT EXISTS idx_nodes_type_conf ON scmlex_nodes(node_type, confidence DESC) INCLUDE (name, description);
+CREATE INDEX IF NOT EXISTS idx_rules_only ON scmlex_nodes(jurisdiction, legal_domain) WHERE node_type = 'rule';
+
+-- Full-text search index
+CREATE INDEX IF NOT EXISTS idx_nodes_search ON scmlex_nodes USING GIN(search_vec);
+
+-- ============================================================================
+-- EDGE INDEXES
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_edges_type ON scmlex_edges(edge_type);
+CREATE INDEX IF NOT EXISTS idx_edges_source_target ON scmlex_edges(source_node_id, target_node_id) INCLUDE (edge_type);
+
+-- Traversals filter edges by type, so key the endpoint lookups on it too
+CREATE INDEX IF NOT EXISTS idx_edges_source_type ON scmlex_edges(source_node_id, edge_type);
+CREATE INDEX IF NOT EXISTS idx_edges_target_type ON scmlex_edges(target_node_id, edge_type);
+CREATE INDEX IF NOT EXISTS idx_edges_deriv_src ON scmlex_edges(source_node_id) WHERE edge_type = 'derivation';
+
+-- Single-column endpoint indexes from older schemas are left prefixes of the
+-- composites above and only add write and COPY cost
+DROP INDEX IF EXISTS idx_edges_source;
+DROP INDEX IF EXISTS idx_edges_target;
+
+-- ============================================================================
+-- HYPEREDGE INDEXES
+-- ============================================================================
+
 CREATE INDEX IF NOT EXISTS idx_hyperedges_type ON scmlex_hyperedges(hyperedge_type);
 CREATE INDEX IF NOT EXISTS idx_hyperedges_sources ON scmlex_hyperedges USING GIN(source_nodes);
 
+-- ============================================================================
+-- EDGE ENDPOINTS
+-- ============================================================================
+
+-- Edges store bare node_ids. scmlex_node_ids keeps node_id globally unique, so
+-- the joins below match at most one node, but a foreign key cannot reference
+-- the partitioned table by node_id alone and endpoint integrity is left to
+-- whatever loads scmlex_edges. Drop the constraints older schemas created.
+ALTER TABLE scmlex_edges DROP CONSTRAINT IF EXISTS fk_source;
+ALTER TABLE scmlex_edges DROP CONSTRAINT IF EXISTS fk_target;
+
 -- ============================================================================
 -- VIEWS FOR COMMON QUERIES
 -- ============================================================================
@@ -144,7 +256,10 @@ SELECT
     r.jurisdiction,
     r.legal_domain,
     e.inference_type,
-    e.confidence_impact
+    e.confidence_impact,
+    -- Stored search documents, so text filters on the view never rebuild tsvectors
+    p.search_vec as principle_search_vec,
+    r.search_vec as rule_search_vec
 FROM scmlex_edges e
 JOIN scmlex_nodes p ON e.source_node_id = p.node_id
 JOIN scmlex_nodes r ON e.target_node_id = r.node_id
@@ -156,6 +271,8 @@ WHERE e.edge_type = 'derivation'
 -- FUNCTIONS FOR GRAPH QUERIES
 -- ============================================================================
 
+-- Plain SQL, STABLE functions are inlined into the calling query by the planner
+
 -- Function: Find principles by domain
 CREATE OR REPLACE FUNCTION find_principles_by_domain(domain_name TEXT)
 RETURNS TABLE (
@@ -164,18 +281,15 @@ RETURNS TABLE (
     description TEXT,
     confidence DECIMAL
 ) AS $$
-BEGIN
-    RETURN QUERY
-    SELECT 
-        n.node_id,
-        n.name,
-        n.description,
-        n.confidence
-    FROM scmlex_nodes n
-    WHERE n.node_type = 'principle'
-        AND domain_name = ANY(n.domains);
-END;
-$$ LANGUAGE plpgsql;
+SELECT 
+    n.node_id,
+    n.name,
+    n.description,
+    n.confidence
+FROM scmlex_nodes n
+WHERE n.node_type = 'principle'
+    AND domain_name = ANY(n.domains);
+$$ LANGUAGE sql STABLE PARALLEL SAFE;
 
 -- Function: Find rules derived from principle
 CREATE OR REPLACE FUNCTION find_rules_from_principle(principle_name TEXT)
@@ -185,21 +299,19 @@ RETURNS TABLE (
     legal_domain TEXT,
     confidence DECIMAL
 ) AS $$
-BEGIN
-    RETURN QUERY
-    SELECT 
-        r.name,
-        r.jurisdiction,
-        r.legal_domain,
-        r.confidence
-    FROM scmlex_edges e
-    JOIN scmlex_nodes p ON e.source_node_id = p.node_id
-    JOIN scmlex_nodes r ON e.target_node_id = r.node_id
-    WHERE p.name = principle_name
-        AND e.edge_type = 'derivation'
-        AND r.node_type = 'rule';
-END;
-$$ LANGUAGE plpgsql;
+SELECT 
+    r.name,
+    r.jurisdiction::TEXT,
+    r.legal_domain::TEXT,
+    r.confidence
+FROM scmlex_edges e
+JOIN scmlex_nodes p ON e.source_node_id = p.node_id
+JOIN scmlex_nodes r ON e.target_node_id = r.node_id
+WHERE p.name = principle_name
+    AND p.node_type = 'principle'
+    AND e.edge_type = 'derivation'
+    AND r.node_type = 'rule';
+$$ LANGUAGE sql STABLE PARALLEL SAFE;
 
 -- Function: Search nodes by keyword
 CREATE OR REPLACE FUNCTION search_nodes(keyword TEXT)
@@ -210,28 +322,37 @@ RETURNS TABLE (
     description TEXT,
     relevance REAL
 ) AS $$
-BEGIN
-    RETURN QUERY
-    SELECT 
-        n.node_id,
-        n.node_type,
-        n.name,
-        n.description,
-        ts_rank(to_tsvector('english', n.name || ' ' || COALESCE(n.description, '')),
-                plainto_tsquery('english', keyword)) as relevance
-    FROM scmlex_nodes n
-    WHERE to_tsvector('english', n.name || ' ' || COALESCE(n.description, '')) 
-          @@ plainto_tsquery('english', keyword)
-    ORDER BY relevance DESC;
-END;
-$$ LANGUAGE plpgsql;
+SELECT 
+    n.node_id,
+    n.node_type,
+    n.name,
+    n.description,
+    ts_rank(n.search_vec, query) as relevance
+FROM scmlex_nodes n, plainto_tsquery('english', keyword) query
+WHERE n.search_vec @@ query
+ORDER BY relevance DESC;
+$$ LANGUAGE sql STABLE PARALLEL SAFE;
 
 -- ============================================================================
 -- STATISTICS VIEW
 -- ============================================================================
 
-CREATE OR REPLACE VIEW v_hypergraph_statistics AS
+-- Materialized so reads are a single-row lookup instead of eight COUNT(*) scans.
+-- Refresh after loading data:
+--   REFRESH MATERIALIZED VIEW CONCURRENTLY v_hypergraph_statistics;
+
+-- Replace the plain view created by earlier schema versions
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_views WHERE viewname = 'v_hypergraph_statistics') THEN
+        DROP VIEW v_hypergraph_statistics;
+    END IF;
+END;
+$$;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS v_hypergraph_statistics AS
 SELECT 
+    1 as stats_id,
     (SELECT COUNT(*) FROM scmlex_nodes) as total_nodes,
     (SELECT COUNT(*) FROM scmlex_nodes WHERE node_type = 'principle') as principle_count,
     (SELECT COUNT(*) FROM scmlex_nodes WHERE node_type = 'rule') as rule_count,
@@ -241,6 +362,9 @@ SELECT
     (SELECT COUNT(*) FROM scmlex_edges WHERE edge_type = 'relationship') as relationship_count,
     (SELECT COUNT(*) FROM scmlex_hyperedges) as hyperedge_count;
 
+-- REFRESH ... CONCURRENTLY needs a unique index on a plain column
+CREATE UNIQUE INDEX IF NOT EXISTS idx_hypergraph_statistics_id ON v_hypergraph_statistics(stats_id);
+
 -- ============================================================================
 -- SAMPLE QUERIES
 -- ============================================================================
@@ -0,0 +1,235 @@
+
+-- SCMLex Hypergraph Database Schema: Post-Load
+-- Version: 1.0
+-- Date: 2025-10-23
+--
+-- Run after the bulk load so every index is built in one pass over the
+-- loaded tables.
+
+-- ============================================================================
+-- NODE INDEXES
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_nodes_level ON scmlex_nodes(level);
+CREATE INDEX IF NOT EXISTS idx_nodes_name ON scmlex_nodes(name);
+CREATE INDEX IF NOT EXISTS idx_nodes_name_trgm ON scmlex_nodes USING GIN(name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_nodes_desc_trgm ON scmlex_nodes USING GIN(description gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_nodes_jurisdiction ON scmlex_nodes(jurisdiction);
+CREATE INDEX IF NOT EXISTS idx_nodes_legal_domain ON scmlex_nodes(legal_domain);
+CREATE INDEX IF NOT EXISTS idx_nodes_domains ON scmlex_nodes USING GIN(domains);
+
+-- Composite and covering indexes matching the view and sample query filters
+CREATE INDEX IF NOT EXISTS idx_nodes_type_level ON scmlex_nodes(node_type, level) INCLUDE (name, confidence);
+CREATE INDEX IF NOT EXISTS idx_nodes_type_jur_dom ON scmlex_nodes(node_type, jurisdiction, legal_domain);
+CREATE INDEX IF NOT EXISTS idx_nodes_type_conf ON scmlex_nodes(node_type, confidence DESC) INCLUDE (name, description);
+CREATE INDEX IF NOT EXISTS idx_rules_only ON scmlex_nodes(jurisdiction, legal_domain) WHERE node_type = 'rule';
+
+-- Full-text search index
+CREATE INDEX IF NOT EXISTS idx_nodes_search ON scmlex_nodes USING GIN(search_vec);
+
+-- ============================================================================
+-- EDGE INDEXES
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_edges_type ON scmlex_edges(edge_type);
+CREATE INDEX IF NOT EXISTS idx_edges_source_target ON scmlex_edges(source_node_id, target_node_id) INCLUDE (edge_type);
+
+-- Traversals filter edges by type, so key the endpoint lookups on it too
+CREATE INDEX IF NOT EXISTS idx_edges_source_type ON scmlex_edges(source_node_id, edge_type);
+CREATE INDEX IF NOT EXISTS idx_edges_target_type ON scmlex_edges(target_node_id, edge_type);
+CREATE INDEX IF NOT EXISTS idx_edges_deriv_src ON scmlex_edges(source_node_id) WHERE edge_type = 'derivation';
+
+-- Single-column endpoint indexes from older schemas are left prefixes of the
+-- composites above and only add write and COPY cost
+DROP INDEX IF EXISTS idx_edges_source;
+DROP INDEX IF EXISTS idx_edges_target;
+
+-- ============================================================================
+-- HYPEREDGE INDEXES
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_hyperedges_type ON scmlex_hyperedges(hyperedge_type);
+CREATE INDEX IF NOT EXISTS idx_hyperedges_sources ON scmlex_hyperedges USING GIN(source_nodes);
+
+-- ============================================================================
+-- EDGE ENDPOINTS
+-- ============================================================================
+
+-- Edges store bare node_ids. scmlex_node_ids keeps node_id globally unique, so
+-- the joins below match at most one node, but a foreign key cannot reference
+-- the partitioned table by node_id alone and endpoint integrity is left to
+-- whatever loads scmlex_edges. Drop the constraints older schemas created.
+ALTER TABLE scmlex_edges DROP CONSTRAINT IF EXISTS fk_source;
+ALTER TABLE scmlex_edges DROP CONSTRAINT IF EXISTS fk_target;
+
+-- ============================================================================
+-- VIEWS FOR COMMON QUERIES
+-- ============================================================================
+
+-- View: All Level 1 Principles
+CREATE OR REPLACE VIEW v_level1_principles AS
+SELECT 
+    node_id,
+    name,
+    description,
+    domains,
+    confidence,
+    provenance
+FROM scmlex_nodes
+WHERE node_type = 'principle' AND level = 1
+ORDER BY name;
+
+-- View: Rules by Jurisdiction
+CREATE OR REPLACE VIEW v_rules_by_jurisdiction AS
+SELECT 
+    jurisdiction,
+    legal_domain,
+    COUNT(*) as rule_count
+FROM scmlex_nodes
+WHERE node_type = 'rule'
+GROUP BY jurisdiction, legal_domain
+ORDER BY jurisdiction, legal_domain;
+
+-- View: Principle-Rule Derivations
+CREATE OR REPLACE VIEW v_principle_rule_derivations AS
+SELECT 
+    p.name as principle_name,
+    r.name as rule_name,
+    r.jurisdiction,
+    r.legal_domain,
+    e.inference_type,
+    e.confidence_impact,
+    -- Stored search documents, so text filters on the view never rebuild tsvectors
+    p.search_vec as principle_search_vec,
+    r.search_vec as rule_search_vec
+FROM scmlex_edges e
+JOIN scmlex_nodes p ON e.source_node_id = p.node_id
+JOIN scmlex_nodes r ON e.target_node_id = r.node_id
+WHERE e.edge_type = 'derivation'
+    AND p.node_type = 'principle'
+    AND r.node_type = 'rule';
+
+-- ============================================================================
+-- FUNCTIONS FOR GRAPH QUERIES
+-- ============================================================================
+
+-- Plain SQL, STABLE functions are inlined into the calling query by the planner
+
+-- Function: Find principles by domain
+CREATE OR REPLACE FUNCTION find_principles_by_domain(domain_name TEXT)
+RETURNS TABLE (
+    node_id TEXT,
+    name TEXT,
+    description TEXT,
+    confidence DECIMAL
+) AS $$
+SELECT 
+    n.node_id,
+    n.name,
+    n.description,
+    n.confidence
+FROM scmlex_nodes n
+WHERE n.node_type = 'principle'
+    AND domain_name = ANY(n.domains);
+$$ LANGUAGE sql STABLE PARALLEL SAFE;
+
+-- Function: Find rules derived from principle
+CREATE OR REPLACE FUNCTION find_rules_from_principle(principle_name TEXT)
+RETURNS TABLE (
+    rule_name TEXT,
+    jurisdiction TEXT,
+    legal_domain TEXT,
+    confidence DECIMAL
+) AS $$
+SELECT 
+    r.name,
+    r.jurisdiction::TEXT,
+    r.legal_domain::TEXT,
+    r.confidence
+FROM scmlex_edges e
+JOIN scmlex_nodes p ON e.source_node_id = p.node_id
+JOIN scmlex_nodes r ON e.target_node_id = r.node_id
+WHERE p.name = principle_name
+    AND p.node_type = 'principle'
+    AND e.edge_type = 'derivation'
+    AND r.node_type = 'rule';
+$$ LANGUAGE sql STABLE PARALLEL SAFE;
+
+-- Function: Search nodes by keyword
+CREATE OR REPLACE FUNCTION search_nodes(keyword TEXT)
+RETURNS TABLE (
+    node_id TEXT,
+    node_type TEXT,
+    name TEXT,
+    description TEXT,
+    relevance REAL
+) AS $$
+SELECT 
+    n.node_id,
+    n.node_type,
+    n.name,
+    n.description,
+    ts_rank(n.search_vec, query) as relevance
+FROM scmlex_nodes n, plainto_tsquery('english', keyword) query
+WHERE n.search_vec @@ query
+ORDER BY relevance DESC;
+$$ LANGUAGE sql STABLE PARALLEL SAFE;
+
+-- ============================================================================
+-- STATISTICS VIEW
+-- ============================================================================
+
+-- Materialized so reads are a single-row lookup instead of eight COUNT(*) scans.
+-- Refresh after loading data:
+--   REFRESH MATERIALIZED VIEW CONCURRENTLY v_hypergraph_statistics;
+
+-- Replace the plain view created by earlier schema versions
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_views WHERE viewname = 'v_hypergraph_statistics') THEN
+        DROP VIEW v_hypergraph_statistics;
+    END IF;
+END;
+$$;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS v_hypergraph_statistics AS
+SELECT 
+    1 as stats_id,
+    (SELECT COUNT(*) FROM scmlex_nodes) as total_nodes,
+    (SELECT COUNT(*) FROM scmlex_nodes WHERE node_type = 'principle') as principle_count,
+    (SELECT COUNT(*) FROM scmlex_nodes WHERE node_type = 'rule') as rule_count,
+    (SELECT COUNT(*) FROM scmlex_nodes WHERE node_type = 'domain') as domain_count,
+    (SELECT COUNT(*) FROM scmlex_edges) as total_edges,
+    (SELECT COUNT(*) FROM scmlex_edges WHERE edge_type = 'derivation') as derivation_count,
+    (SELECT COUNT(*) FROM scmlex_edges WHERE edge_type = 'relationship') as relationship_count,
+    (SELECT COUNT(*) FROM scmlex_hyperedges) as hyperedge_count;
+
+-- REFRESH ... CONCURRENTLY needs a unique index on a plain column
+CREATE UNIQUE INDEX IF NOT EXISTS idx_hypergraph_statistics_id ON v_hypergraph_statistics(stats_id);
+
+-- ============================================================================
+-- SAMPLE QUERIES
+-- ============================================================================
+
+-- Query 1: Get all contract law principles
+-- SELECT * FROM find_principles_by_domain('contract');
+
+-- Query 2: Find rules derived from pacta-sunt-servanda
+-- SELECT * FROM find_rules_from_principle('pacta-sunt-servanda');
+
+-- Query 3: Search for "contract" in all nodes
+-- SELECT * FROM search_nodes('contract') LIMIT 10;
+
+-- Query 4: Get statistics
+-- SELECT * FROM v_hypergraph_statistics;
+
+-- Query 5: Find most connected principles (by outgoing edges)
+-- SELECT 
+--     n.name,
+--     COUNT(e.id) as connection_count
+-- FROM scmlex_nodes n
+-- LEFT JOIN scmlex_edges e ON n.node_id = e.source_node_id
+-- WHERE n.node_type = 'principle'
+-- GROUP BY n.name
+-- ORDER BY connection_count DESC
+-- LIMIT 10;
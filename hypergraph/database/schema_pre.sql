@@ -0,0 +1,158 @@
+
+-- SCMLex Hypergraph Database Schema: Pre-Load
+-- Version: 1.0
+-- Date: 2025-10-23
+--
+-- Tables, partitions, primary keys and the search_vec trigger only. Bulk load
+-- the data, then run the post-load script to build indexes, views and
+-- functions.
+
+-- Enable trigram matching for substring and fuzzy name lookups
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Enable case-insensitive text for jurisdiction and domain codes
+CREATE EXTENSION IF NOT EXISTS citext;
+
+-- ============================================================================
+-- NODES TABLE (list-partitioned by node_type)
+-- ============================================================================
+
+-- Every view and query filters on node_type, so each one is pruned to a single
+-- partition. Unique keys on a partitioned table must include the partition key,
+-- hence (id, node_type) and (node_id, node_type). BIGSERIAL rather than an
+-- identity column, which partitioned tables only accept from PostgreSQL 17.
+CREATE TABLE IF NOT EXISTS scmlex_nodes (
+    id BIGSERIAL,
+    node_id TEXT NOT NULL,
+    node_type TEXT NOT NULL CHECK (node_type IN ('principle', 'rule', 'concept', 'domain')),
+    level INTEGER,
+    name TEXT NOT NULL,
+    description TEXT,
+    
+    -- Principle-specific fields
+    provenance TEXT,
+    application_context TEXT,
+    
+    -- Rule-specific fields (CITEXT: 'za' and 'ZA' compare equal and share the btree)
+    jurisdiction CITEXT,
+    legal_domain CITEXT,
+    
+    -- Common fields
+    confidence DECIMAL(3,2) DEFAULT 1.0,
+    inference_type TEXT,
+    
+    -- Array fields
+    domains TEXT[],
+    derived_from TEXT[],
+    
+    -- Full-text search document, maintained by scmlex_nodes_tsv_trigger
+    search_vec TSVECTOR,
+    
+    -- Metadata
+    created_at TIMESTAMP DEFAULT NOW(),
+    updated_at TIMESTAMP DEFAULT NOW(),
+    
+    PRIMARY KEY (id, node_type),
+    UNIQUE (node_id, node_type)
+) PARTITION BY LIST (node_type);
+
+CREATE TABLE IF NOT EXISTS scmlex_nodes_principle PARTITION OF scmlex_nodes FOR VALUES IN ('principle');
+CREATE TABLE IF NOT EXISTS scmlex_nodes_rule PARTITION OF scmlex_nodes FOR VALUES IN ('rule');
+CREATE TABLE IF NOT EXISTS scmlex_nodes_concept PARTITION OF scmlex_nodes FOR VALUES IN ('concept');
+CREATE TABLE IF NOT EXISTS scmlex_nodes_domain PARTITION OF scmlex_nodes FOR VALUES IN ('domain');
+
+-- Keep search_vec in sync on every write, including rows arriving through COPY
+CREATE OR REPLACE FUNCTION scmlex_nodes_tsv_trigger() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vec := to_tsvector('english', COALESCE(NEW.name, '') || ' ' || COALESCE(NEW.description, ''));
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS tsvupdate ON scmlex_nodes;
+CREATE TRIGGER tsvupdate BEFORE INSERT OR UPDATE ON scmlex_nodes
+    FOR EACH ROW EXECUTE FUNCTION scmlex_nodes_tsv_trigger();
+
+-- The partitioned table can only enforce (node_id, node_type), but edges, views
+-- and functions join on node_id alone. Each node_id claims a row here, so the
+-- same id can never be loaded under two node types.
+CREATE TABLE IF NOT EXISTS scmlex_node_ids (
+    node_id TEXT PRIMARY KEY,
+    node_type TEXT NOT NULL
+);
+
+-- Claim ids that predate the guard
+INSERT INTO scmlex_node_ids (node_id, node_type)
+SELECT node_id, node_type FROM scmlex_nodes
+ON CONFLICT (node_id) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION scmlex_node_ids_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        DELETE FROM scmlex_node_ids WHERE node_id = OLD.node_id AND node_type = OLD.node_type;
+    END IF;
+    IF TG_OP = 'DELETE' THEN
+        RETURN OLD;
+    END IF;
+    
+    -- Re-inserting an id under its own type (a re-run load) is not a conflict
+    INSERT INTO scmlex_node_ids (node_id, node_type) VALUES (NEW.node_id, NEW.node_type)
+        ON CONFLICT (node_id) DO NOTHING;
+    IF NOT FOUND AND NOT EXISTS (SELECT 1 FROM scmlex_node_ids
+                                 WHERE node_id = NEW.node_id AND node_type = NEW.node_type) THEN
+        RAISE EXCEPTION 'node_id % already exists under another node_type', NEW.node_id
+            USING ERRCODE = 'unique_violation';
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS node_id_unique ON scmlex_nodes;
+CREATE TRIGGER node_id_unique BEFORE INSERT OR UPDATE OF node_id, node_type OR DELETE ON scmlex_nodes
+    FOR EACH ROW EXECUTE FUNCTION scmlex_node_ids_trigger();
+
+-- ============================================================================
+-- EDGES TABLE
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS scmlex_edges (
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    edge_id TEXT UNIQUE,
+    edge_type TEXT NOT NULL CHECK (edge_type IN ('relationship', 'derivation', 'domain_membership')),
+    source_node_id TEXT NOT NULL,
+    target_node_id TEXT NOT NULL,
+    
+    -- Edge attributes
+    relationship_name TEXT,
+    inference_type TEXT,
+    confidence_impact DECIMAL(3,2),
+    strength DECIMAL(3,2),
+    description TEXT,
+    
+    -- Metadata
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+-- ============================================================================
+-- HYPEREDGES TABLE (for edges connecting multiple nodes)
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS scmlex_hyperedges (
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    hyperedge_id TEXT UNIQUE NOT NULL,
+    hyperedge_type TEXT NOT NULL,
+    source_nodes TEXT[] NOT NULL,
+    target_node TEXT,
+    target_nodes TEXT[],
+    
+    -- Attributes
+    inference_type TEXT,
+    confidence_impact DECIMAL(3,2),
+    relationship_name TEXT,
+    strength DECIMAL(3,2),
+    description TEXT,
+    
+    -- Metadata
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
@@ -10,6 +10,7 @@ Usage:
     python hypergraph/db_connect.py --init              # Initialize schema
     python hypergraph/db_connect.py --load              # Load hypergraph data
     python hypergraph/db_connect.py --query <query>     # Execute a query
+    python hypergraph/db_connect.py --init --load       # Several operations, one connection
 """
 
 import os
@@ -32,6 +33,13 @@ except ImportError:
     print("Warning: python-dotenv not installed. Install with: pip install python-dotenv")
     load_dotenv = None
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from db_integration import DatabaseIntegration
+
 
 class DatabaseConnection:
     """Manages PostgreSQL database connections for SCMLex Hypergraph"""
@@ -80,15 +88,27 @@ class DatabaseConnection:
         self.conn = None
         self.cursor = None
     
+    def __enter__(self) -> 'DatabaseConnection':
+        """Use as a context manager so operations share one connection."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the shared connection, discarding any uncommitted work."""
+        self.disconnect()
+    
     def connect(self) -> bool:
         """
-        Establish database connection.
+        Establish database connection, reusing the open one if there is one.
         
         Returns:
             True if connection successful, False otherwise
         """
+        if self.conn is not None and not self.conn.closed:
+            return True
+        
         try:
             self.conn = psycopg2.connect(self.connection_string)
+            self.conn.autocommit = False
             self.cursor = self.conn.cursor(cursor_factory=RealDictCursor)
             return True
         except psycopg2.Error as e:
@@ -101,6 +121,8 @@ class DatabaseConnection:
             self.cursor.close()
         if self.conn:
             self.conn.close()
+        self.cursor = None
+        self.conn = None
     
     def test_connection(self) -> bool:
         """
@@ -138,9 +160,8 @@ class DatabaseConnection:
             return True
         except psycopg2.Error as e:
             print(f"❌ Error testing connection: {e}")
+            self.conn.rollback()
             return False
-        finally:
-            self.disconnect()
     
     def execute_sql_file(self, sql_file: Path) -> bool:
         """
@@ -171,8 +192,6 @@ class DatabaseConnection:
             print(f"❌ Error executing SQL file: {e}")
             self.conn.rollback()
             return False
-        finally:
-            self.disconnect()
     
     def initialize_schema(self) -> bool:
         """
@@ -203,36 +222,23 @@ class DatabaseConnection:
             return False
         
         try:
-            with open(tuples_file, 'r') as f:
-                data = json.load(f)
-            
-            # Load nodes
-            principles = data.get('nodes', {}).get('principles', [])
-            print(f"Loading {len(principles)} principles...")
-            
-            for principle in principles:
-                domains_array = principle.get('domains', [])
+            with open(tuples_file, 'rb') as f:
+                # Stream principles one record at a time when ijson is available
+                if ijson is not None:
+                    principles = ijson.items(f, 'nodes.principles.item', use_float=True)
+                else:
+                    principles = json.load(f).get('nodes', {}).get('principles', [])
                 
-                self.cursor.execute("""
-                    INSERT INTO scmlex_nodes (
-                        node_id, node_type, level, name, description, 
-                        domains, confidence, provenance, inference_type, application_context
-                    ) VALUES (
-                        %s, 'principle', 1, %s, %s, %s, %s, %s, %s, %s
-                    ) ON CONFLICT (node_id) DO NOTHING;
-                """, (
-                    principle['node_id'],
-                    principle.get('name', ''),
-                    principle.get('description', ''),
-                    domains_array,
-                    principle.get('confidence', 1.0),
-                    principle.get('provenance', ''),
-                    principle.get('inference_type', ''),
-                    principle.get('application_context', '')
-                ))
+                # Stage through COPY and merge with ON CONFLICT, so this serves both
+                # the initial ingest and incremental re-runs
+                inserted = DatabaseIntegration().copy_principles(self.cursor, principles)
+            
+            self.conn.commit()
+            print(f"✅ Successfully loaded {inserted} new principles")
             
+            # Statistics are materialized, so bring them up to date with the new rows
+            self.cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY v_hypergraph_statistics;")
             self.conn.commit()
-            print(f"✅ Successfully loaded {len(principles)} principles")
             
             # Get statistics
             self.cursor.execute("SELECT * FROM v_hypergraph_statistics;")
@@ -251,9 +257,8 @@ class DatabaseConnection:
             return False
         except Exception as e:
             print(f"❌ Error processing data: {e}")
+            self.conn.rollback()
             return False
-        finally:
-            self.disconnect()
     
     def execute_query(self, query: str) -> Optional[List[Dict[str, Any]]]:
         """
@@ -274,9 +279,8 @@ class DatabaseConnection:
             return [dict(row) for row in results]
         except psycopg2.Error as e:
             print(f"❌ Error executing query: {e}")
+            self.conn.rollback()
             return None
-        finally:
-            self.disconnect()
 
 
 def main():
@@ -289,6 +293,7 @@ Examples:
   python hypergraph/db_connect.py --test              # Test connection
   python hypergraph/db_connect.py --init              # Initialize schema
   python hypergraph/db_connect.py --load              # Load data
+  python hypergraph/db_connect.py --init --load       # Initialize and load over one connection
   python hypergraph/db_connect.py --query "SELECT * FROM v_hypergraph_statistics;"
         """
     )
@@ -312,27 +317,24 @@ Examples:
         sys.exit(0)
     
     try:
-        db = DatabaseConnection(args.connection_string)
-        
-        if args.test:
-            success = db.test_connection()
-            sys.exit(0 if success else 1)
-        
-        if args.init:
-            success = db.initialize_schema()
-            sys.exit(0 if success else 1)
-        
-        if args.load:
-            success = db.load_hypergraph_data()
-            sys.exit(0 if success else 1)
-        
-        if args.query:
-            results = db.execute_query(args.query)
-            if results is not None:
-                print(json.dumps(results, indent=2, default=str))
-                sys.exit(0)
-            else:
+        # Requested operations run in order over a single shared connection
+        with DatabaseConnection(args.connection_string) as db:
+            if args.test and not db.test_connection():
                 sys.exit(1)
+            
+            if args.init and not db.initialize_schema():
+                sys.exit(1)
+            
+            if args.load and not db.load_hypergraph_data():
+                sys.exit(1)
+            
+            if args.query:
+                results = db.execute_query(args.query)
+                if results is None:
+                    sys.exit(1)
+                print(json.dumps(results, indent=2, default=str))
+        
+        sys.exit(0)
     
     except ValueError as e:
         print(f"❌ Configuration Error: {e}")
@@ -9,15 +9,113 @@ Integrates the hypergraph with Neon/Supabase PostgreSQL databases:
 4. Provide SQL query examples
 """
 
+import io
 import json
 import os
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Any, Iterable, Iterator, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from psycopg2.extras import execute_batch
+except ImportError:
+    execute_batch = None
 
 # Database connection info from environment
 SUPABASE_URL = os.getenv('SUPABASE_URL', '')
 SUPABASE_KEY = os.getenv('SUPABASE_KEY', '')
 
+# Columns loaded for Level 1 principles, in COPY order
+PRINCIPLE_COLUMNS = ('node_id', 'node_type', 'level', 'name', 'description', 'domains',
+                     'confidence', 'provenance', 'inference_type', 'application_context')
+
+_COLUMN_LIST = ', '.join(PRINCIPLE_COLUMNS)
+
+# COPY cannot resolve conflicts, so rows land in a typed staging table first and are
+# merged with a single INSERT ... SELECT that keeps the loader re-runnable
+_CREATE_STAGING = (f"CREATE TEMP TABLE scmlex_nodes_load ON COMMIT DROP AS\n"
+                   f"    SELECT {_COLUMN_LIST} FROM scmlex_nodes WITH NO DATA;")
+_COPY_STAGING = f"COPY scmlex_nodes_load ({_COLUMN_LIST}) FROM STDIN"
+_MERGE_STAGING = (f"INSERT INTO scmlex_nodes ({_COLUMN_LIST})\n"
+                  f"SELECT {_COLUMN_LIST} FROM scmlex_nodes_load\n"
+                  f"ON CONFLICT (node_id, node_type) DO NOTHING;")
+
+# Parameterized single-row insert for the execute_batch loader
+_INSERT_PRINCIPLE = (f"INSERT INTO scmlex_nodes ({_COLUMN_LIST})\n"
+                     f"VALUES ({', '.join(['%s'] * len(PRINCIPLE_COLUMNS))})\n"
+                     f"ON CONFLICT (node_id, node_type) DO NOTHING")
+
+def _load_tuples(tuples_file: str) -> Dict:
+    """Read tuples.json, parsing with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(Path(tuples_file).read_bytes())
+    with open(tuples_file, 'r') as f:
+        return json.load(f)
+
+def _copy_text(value: Any) -> str:
+    """Render a value as one field of PostgreSQL's COPY text format"""
+    if value is None:
+        return '\\N'
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+def _array_literal(values: Iterable) -> str:
+    """Render values as a PostgreSQL array literal with every element quoted"""
+    return '{' + ','.join('"' + str(v).replace('\\', '\\\\').replace('"', '\\"') + '"'
+                          for v in values) + '}'
+
+def _principle_rows(principles: Iterable[Dict]) -> Iterator[Tuple]:
+    """Yield one row per principle, in PRINCIPLE_COLUMNS order"""
+    for principle in principles:
+        yield (
+            principle['node_id'],
+            'principle',
+            1,
+            principle.get('name', ''),
+            principle.get('description', ''),
+            principle.get('domains', []),
+            principle.get('confidence', 1.0),
+            principle.get('provenance', ''),
+            principle.get('inference_type', ''),
+            principle.get('application_context', '')
+        )
+
+def _principle_copy_lines(principles: Iterable[Dict]) -> Iterator[str]:
+    """Yield one tab-delimited COPY line per principle"""
+    for row in _principle_rows(principles):
+        yield '\t'.join(_copy_text(_array_literal(v) if isinstance(v, list) else v)
+                         for v in row) + '\n'
+
+class _LineReader(io.TextIOBase):
+    """Read-only text stream over an iterator of lines, consumed lazily by read()"""
+    
+    def __init__(self, lines: Iterable[str]):
+        self._lines = iter(lines)
+        self._pending = ''
+    
+    def readable(self) -> bool:
+        return True
+    
+    def read(self, size: int = -1) -> str:
+        if size is None or size < 0:
+            data, self._pending = self._pending + ''.join(self._lines), ''
+            return data
+        chunks = [self._pending]
+        length = len(self._pending)
+        while length < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            chunks.append(line)
+            length += len(line)
+        data = ''.join(chunks)
+        self._pending = data[size:]
+        return data[:size]
+
 class DatabaseIntegration:
     """Integrate hypergraph with PostgreSQL database"""
     
@@ -25,23 +123,34 @@ class DatabaseIntegration:
         self.schema_sql = []
         self.insert_sql = []
         
-    def generate_schema(self) -> str:
-        """Generate PostgreSQL schema for hypergraph"""
+    def generate_schema_pre_load(self) -> str:
+        """Generate the tables that must exist before a bulk load"""
         schema = """
--- SCMLex Hypergraph Database Schema
+-- SCMLex Hypergraph Database Schema: Pre-Load
 -- Version: 1.0
 -- Date: 2025-10-23
+--
+-- Tables, partitions, primary keys and the search_vec trigger only. Bulk load
+-- the data, then run the post-load script to build indexes, views and
+-- functions.
 
--- Enable UUID extension
-CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+-- Enable trigram matching for substring and fuzzy name lookups
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Enable case-insensitive text for jurisdiction and domain codes
+CREATE EXTENSION IF NOT EXISTS citext;
 
 -- ============================================================================
--- NODES TABLE
+-- NODES TABLE (list-partitioned by node_type)
 -- ============================================================================
 
+-- Every view and query filters on node_type, so each one is pruned to a single
+-- partition. Unique keys on a partitioned table must include the partition key,
+-- hence (id, node_type) and (node_id, node_type). BIGSERIAL rather than an
+-- identity column, which partitioned tables only accept from PostgreSQL 17.
 CREATE TABLE IF NOT EXISTS scmlex_nodes (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-    node_id TEXT UNIQUE NOT NULL,
+    id BIGSERIAL,
+    node_id TEXT NOT NULL,
     node_type TEXT NOT NULL CHECK (node_type IN ('principle', 'rule', 'concept', 'domain')),
     level INTEGER,
     name TEXT NOT NULL,
@@ -51,9 +160,9 @@ CREATE TABLE IF NOT EXISTS scmlex_nodes (
     provenance TEXT,
     application_context TEXT,
     
-    -- Rule-specific fields
-    jurisdiction TEXT,
-    legal_domain TEXT,
+    -- Rule-specific fields (CITEXT: 'za' and 'ZA' compare equal and share the btree)
+    jurisdiction CITEXT,
+    legal_domain CITEXT,
     
     -- Common fields
     confidence DECIMAL(3,2) DEFAULT 1.0,
@@ -63,33 +172,82 @@ CREATE TABLE IF NOT EXISTS scmlex_nodes (
     domains TEXT[],
     derived_from TEXT[],
     
+    -- Full-text search document, maintained by scmlex_nodes_tsv_trigger
+    search_vec TSVECTOR,
+    
     -- Metadata
     created_at TIMESTAMP DEFAULT NOW(),
-    updated_at TIMESTAMP DEFAULT NOW()
+    updated_at TIMESTAMP DEFAULT NOW(),
+    
+    PRIMARY KEY (id, node_type),
+    UNIQUE (node_id, node_type)
+) PARTITION BY LIST (node_type);
+
+CREATE TABLE IF NOT EXISTS scmlex_nodes_principle PARTITION OF scmlex_nodes FOR VALUES IN ('principle');
+CREATE TABLE IF NOT EXISTS scmlex_nodes_rule PARTITION OF scmlex_nodes FOR VALUES IN ('rule');
+CREATE TABLE IF NOT EXISTS scmlex_nodes_concept PARTITION OF scmlex_nodes FOR VALUES IN ('concept');
+CREATE TABLE IF NOT EXISTS scmlex_nodes_domain PARTITION OF scmlex_nodes FOR VALUES IN ('domain');
+
+-- Keep search_vec in sync on every write, including rows arriving through COPY
+CREATE OR REPLACE FUNCTION scmlex_nodes_tsv_trigger() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vec := to_tsvector('english', COALESCE(NEW.name, '') || ' ' || COALESCE(NEW.description, ''));
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS tsvupdate ON scmlex_nodes;
+CREATE TRIGGER tsvupdate BEFORE INSERT OR UPDATE ON scmlex_nodes
+    FOR EACH ROW EXECUTE FUNCTION scmlex_nodes_tsv_trigger();
+
+-- The partitioned table can only enforce (node_id, node_type), but edges, views
+-- and functions join on node_id alone. Each node_id claims a row here, so the
+-- same id can never be loaded under two node types.
+CREATE TABLE IF NOT EXISTS scmlex_node_ids (
+    node_id TEXT PRIMARY KEY,
+    node_type TEXT NOT NULL
 );
 
--- Indexes for efficient queries
-CREATE INDEX IF NOT EXISTS idx_nodes_type ON scmlex_nodes(node_type);
-CREATE INDEX IF NOT EXISTS idx_nodes_level ON scmlex_nodes(level);
-CREATE INDEX IF NOT EXISTS idx_nodes_name ON scmlex_nodes(name);
-CREATE INDEX IF NOT EXISTS idx_nodes_jurisdiction ON scmlex_nodes(jurisdiction);
-CREATE INDEX IF NOT EXISTS idx_nodes_legal_domain ON scmlex_nodes(legal_domain);
-CREATE INDEX IF NOT EXISTS idx_nodes_domains ON scmlex_nodes USING GIN(domains);
+-- Claim ids that predate the guard
+INSERT INTO scmlex_node_ids (node_id, node_type)
+SELECT node_id, node_type FROM scmlex_nodes
+ON CONFLICT (node_id) DO NOTHING;
 
--- Full-text search index
-CREATE INDEX IF NOT EXISTS idx_nodes_search ON scmlex_nodes 
-    USING GIN(to_tsvector('english', name || ' ' || COALESCE(description, '')));
+CREATE OR REPLACE FUNCTION scmlex_node_ids_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        DELETE FROM scmlex_node_ids WHERE node_id = OLD.node_id AND node_type = OLD.node_type;
+    END IF;
+    IF TG_OP = 'DELETE' THEN
+        RETURN OLD;
+    END IF;
+    
+    -- Re-inserting an id under its own type (a re-run load) is not a conflict
+    INSERT INTO scmlex_node_ids (node_id, node_type) VALUES (NEW.node_id, NEW.node_type)
+        ON CONFLICT (node_id) DO NOTHING;
+    IF NOT FOUND AND NOT EXISTS (SELECT 1 FROM scmlex_node_ids
+                                 WHERE node_id = NEW.node_id AND node_type = NEW.node_type) THEN
+        RAISE EXCEPTION 'node_id % already exists under another node_type', NEW.node_id
+            USING ERRCODE = 'unique_violation';
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS node_id_unique ON scmlex_nodes;
+CREATE TRIGGER node_id_unique BEFORE INSERT OR UPDATE OF node_id, node_type OR DELETE ON scmlex_nodes
+    FOR EACH ROW EXECUTE FUNCTION scmlex_node_ids_trigger();
 
 -- ============================================================================
 -- EDGES TABLE
 -- ============================================================================
 
 CREATE TABLE IF NOT EXISTS scmlex_edges (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
     edge_id TEXT UNIQUE,
     edge_type TEXT NOT NULL CHECK (edge_type IN ('relationship', 'derivation', 'domain_membership')),
-    source_node_id TEXT NOT NULL REFERENCES scmlex_nodes(node_id),
-    target_node_id TEXT NOT NULL REFERENCES scmlex_nodes(node_id),
+    source_node_id TEXT NOT NULL,
+    target_node_id TEXT NOT NULL,
     
     -- Edge attributes
     relationship_name TEXT,
@@ -99,24 +257,15 @@ CREATE TABLE IF NOT EXISTS scmlex_edges (
     description TEXT,
     
     -- Metadata
-    created_at TIMESTAMP DEFAULT NOW(),
-    
-    CONSTRAINT fk_source FOREIGN KEY (source_node_id) REFERENCES scmlex_nodes(node_id),
-    CONSTRAINT fk_target FOREIGN KEY (target_node_id) REFERENCES scmlex_nodes(node_id)
+    created_at TIMESTAMP DEFAULT NOW()
 );
 
--- Indexes for efficient queries
-CREATE INDEX IF NOT EXISTS idx_edges_type ON scmlex_edges(edge_type);
-CREATE INDEX IF NOT EXISTS idx_edges_source ON scmlex_edges(source_node_id);
-CREATE INDEX IF NOT EXISTS idx_edges_target ON scmlex_edges(target_node_id);
-CREATE INDEX IF NOT EXISTS idx_edges_source_target ON scmlex_edges(source_node_id, target_node_id);
-
 -- ============================================================================
 -- HYPEREDGES TABLE (for edges connecting multiple nodes)
 -- ============================================================================
 
 CREATE TABLE IF NOT EXISTS scmlex_hyperedges (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
     hyperedge_id TEXT UNIQUE NOT NULL,
     hyperedge_type TEXT NOT NULL,
     source_nodes TEXT[] NOT NULL,
@@ -134,9 +283,75 @@ CREATE TABLE IF NOT EXISTS scmlex_hyperedges (
     created_at TIMESTAMP DEFAULT NOW()
 );
 
+"""
+        return schema
+    
+    def generate_schema_post_load(self) -> str:
+        """Generate indexes, views and functions to apply after a bulk load"""
+        schema = """
+-- SCMLex Hypergraph Database Schema: Post-Load
+-- Version: 1.0
+-- Date: 2025-10-23
+--
+-- Run after the bulk load so every index is built in one pass over the
+-- loaded tables.
+
+-- ============================================================================
+-- NODE INDEXES
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_nodes_level ON scmlex_nodes(level);
+CREATE INDEX IF NOT EXISTS idx_nodes_name ON scmlex_nodes(name);
+CREATE INDEX IF NOT EXISTS idx_nodes_name_trgm ON scmlex_nodes USING GIN(name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_nodes_desc_trgm ON scmlex_nodes USING GIN(description gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_nodes_jurisdiction ON scmlex_nodes(jurisdiction);
+CREATE INDEX IF NOT EXISTS idx_nodes_legal_domain ON scmlex_nodes(legal_domain);
+CREATE INDEX IF NOT EXISTS idx_nodes_domains ON scmlex_nodes USING GIN(domains);
+
+-- Composite and covering indexes matching the view and sample query filters
+CREATE INDEX IF NOT EXISTS idx_nodes_type_level ON scmlex_nodes(node_type, level) INCLUDE (name, confidence);
+CREATE INDEX IF NOT EXISTS idx_nodes_type_jur_dom ON scmlex_nodes(node_type, jurisdiction, legal_domain);
+CREATE INDEX IF NOT EXISTS idx_nodes_type_conf ON scmlex_nodes(node_type, confidence DESC) INCLUDE (name, description);
+CREATE INDEX IF NOT EXISTS idx_rules_only ON scmlex_nodes(jurisdiction, legal_domain) WHERE node_type = 'rule';
+
+-- Full-text search index
+CREATE INDEX IF NOT EXISTS idx_nodes_search ON scmlex_nodes USING GIN(search_vec);
+
+-- ============================================================================
+-- EDGE INDEXES
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_edges_type ON scmlex_edges(edge_type);
+CREATE INDEX IF NOT EXISTS idx_edges_source_target ON scmlex_edges(source_node_id, target_node_id) INCLUDE (edge_type);
+
+-- Traversals filter edges by type, so key the endpoint lookups on it too
+CREATE INDEX IF NOT EXISTS idx_edges_source_type ON scmlex_edges(source_node_id, edge_type);
+CREATE INDEX IF NOT EXISTS idx_edges_target_type ON scmlex_edges(target_node_id, edge_type);
+CREATE INDEX IF NOT EXISTS idx_edges_deriv_src ON scmlex_edges(source_node_id) WHERE edge_type = 'derivation';
+
+-- Single-column endpoint indexes from older schemas are left prefixes of the
+-- composites above and only add write and COPY cost
+DROP INDEX IF EXISTS idx_edges_source;
+DROP INDEX IF EXISTS idx_edges_target;
+
+-- ============================================================================
+-- HYPEREDGE INDEXES
+-- ============================================================================
+
 CREATE INDEX IF NOT EXISTS idx_hyperedges_type ON scmlex_hyperedges(hyperedge_type);
 CREATE INDEX IF NOT EXISTS idx_hyperedges_sources ON scmlex_hyperedges USING GIN(source_nodes);
 
+-- ============================================================================
+-- EDGE ENDPOINTS
+-- ============================================================================
+
+-- Edges store bare node_ids. scmlex_node_ids keeps node_id globally unique, so
+-- the joins below match at most one node, but a foreign key cannot reference
+-- the partitioned table by node_id alone and endpoint integrity is left to
+-- whatever loads scmlex_edges. Drop the constraints older schemas created.
+ALTER TABLE scmlex_edges DROP CONSTRAINT IF EXISTS fk_source;
+ALTER TABLE scmlex_edges DROP CONSTRAINT IF EXISTS fk_target;
+
 -- ============================================================================
 -- VIEWS FOR COMMON QUERIES
 -- ============================================================================
@@ -173,7 +388,10 @@ SELECT
     r.jurisdiction,
     r.legal_domain,
     e.inference_type,
-    e.confidence_impact
+    e.confidence_impact,
+    -- Stored search documents, so text filters on the view never rebuild tsvectors
+    p.search_vec as principle_search_vec,
+    r.search_vec as rule_search_vec
 FROM scmlex_edges e
 JOIN scmlex_nodes p ON e.source_node_id = p.node_id
 JOIN scmlex_nodes r ON e.target_node_id = r.node_id
@@ -185,6 +403,8 @@ WHERE e.edge_type = 'derivation'
 -- FUNCTIONS FOR GRAPH QUERIES
 -- ============================================================================
 
+-- Plain SQL, STABLE functions are inlined into the calling query by the planner
+
 -- Function: Find principles by domain
 CREATE OR REPLACE FUNCTION find_principles_by_domain(domain_name TEXT)
 RETURNS TABLE (
@@ -193,18 +413,15 @@ RETURNS TABLE (
     description TEXT,
     confidence DECIMAL
 ) AS $$
-BEGIN
-    RETURN QUERY
-    SELECT 
-        n.node_id,
-        n.name,
-        n.description,
-        n.confidence
-    FROM scmlex_nodes n
-    WHERE n.node_type = 'principle'
-        AND domain_name = ANY(n.domains);
-END;
-$$ LANGUAGE plpgsql;
+SELECT 
+    n.node_id,
+    n.name,
+    n.description,
+    n.confidence
+FROM scmlex_nodes n
+WHERE n.node_type = 'principle'
+    AND domain_name = ANY(n.domains);
+$$ LANGUAGE sql STABLE PARALLEL SAFE;
 
 -- Function: Find rules derived from principle
 CREATE OR REPLACE FUNCTION find_rules_from_principle(principle_name TEXT)
@@ -214,21 +431,19 @@ RETURNS TABLE (
     legal_domain TEXT,
     confidence DECIMAL
 ) AS $$
-BEGIN
-    RETURN QUERY
-    SELECT 
-        r.name,
-        r.jurisdiction,
-        r.legal_domain,
-        r.confidence
-    FROM scmlex_edges e
-    JOIN scmlex_nodes p ON e.source_node_id = p.node_id
-    JOIN scmlex_nodes r ON e.target_node_id = r.node_id
-    WHERE p.name = principle_name
-        AND e.edge_type = 'derivation'
-        AND r.node_type = 'rule';
-END;
-$$ LANGUAGE plpgsql;
+SELECT 
+    r.name,
+    r.jurisdiction::TEXT,
+    r.legal_domain::TEXT,
+    r.confidence
+FROM scmlex_edges e
+JOIN scmlex_nodes p ON e.source_node_id = p.node_id
+JOIN scmlex_nodes r ON e.target_node_id = r.node_id
+WHERE p.name = principle_name
+    AND p.node_type = 'principle'
+    AND e.edge_type = 'derivation'
+    AND r.node_type = 'rule';
+$$ LANGUAGE sql STABLE PARALLEL SAFE;
 
 -- Function: Search nodes by keyword
 CREATE OR REPLACE FUNCTION search_nodes(keyword TEXT)
@@ -239,28 +454,37 @@ RETURNS TABLE (
     description TEXT,
     relevance REAL
 ) AS $$
-BEGIN
-    RETURN QUERY
-    SELECT 
-        n.node_id,
-        n.node_type,
-        n.name,
-        n.description,
-        ts_rank(to_tsvector('english', n.name || ' ' || COALESCE(n.description, '')),
-                plainto_tsquery('english', keyword)) as relevance
-    FROM scmlex_nodes n
-    WHERE to_tsvector('english', n.name || ' ' || COALESCE(n.description, '')) 
-          @@ plainto_tsquery('english', keyword)
-    ORDER BY relevance DESC;
-END;
-$$ LANGUAGE plpgsql;
+SELECT 
+    n.node_id,
+    n.node_type,
+    n.name,
+    n.description,
+    ts_rank(n.search_vec, query) as relevance
+FROM scmlex_nodes n, plainto_tsquery('english', keyword) query
+WHERE n.search_vec @@ query
+ORDER BY relevance DESC;
+$$ LANGUAGE sql STABLE PARALLEL SAFE;
 
 -- ============================================================================
 -- STATISTICS VIEW
 -- ============================================================================
 
-CREATE OR REPLACE VIEW v_hypergraph_statistics AS
+-- Materialized so reads are a single-row lookup instead of eight COUNT(*) scans.
+-- Refresh after loading data:
+--   REFRESH MATERIALIZED VIEW CONCURRENTLY v_hypergraph_statistics;
+
+-- Replace the plain view created by earlier schema versions
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_views WHERE viewname = 'v_hypergraph_statistics') THEN
+        DROP VIEW v_hypergraph_statistics;
+    END IF;
+END;
+$$;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS v_hypergraph_statistics AS
 SELECT 
+    1 as stats_id,
     (SELECT COUNT(*) FROM scmlex_nodes) as total_nodes,
     (SELECT COUNT(*) FROM scmlex_nodes WHERE node_type = 'principle') as principle_count,
     (SELECT COUNT(*) FROM scmlex_nodes WHERE node_type = 'rule') as rule_count,
@@ -270,6 +494,9 @@ SELECT
     (SELECT COUNT(*) FROM scmlex_edges WHERE edge_type = 'relationship') as relationship_count,
     (SELECT COUNT(*) FROM scmlex_hyperedges) as hyperedge_count;
 
+-- REFRESH ... CONCURRENTLY needs a unique index on a plain column
+CREATE UNIQUE INDEX IF NOT EXISTS idx_hypergraph_statistics_id ON v_hypergraph_statistics(stats_id);
+
 -- ============================================================================
 -- SAMPLE QUERIES
 -- ============================================================================
@@ -299,43 +526,86 @@ SELECT
 """
         return schema
     
+    def generate_schema(self) -> str:
+        """Generate PostgreSQL schema for hypergraph"""
+        return self.generate_schema_pre_load() + self.generate_schema_post_load()
+    
     def generate_data_load_script(self, tuples_file: str) -> str:
         """Generate SQL script to load data from JSON"""
-        with open(tuples_file, 'r') as f:
-            data = json.load(f)
+        data = _load_tuples(tuples_file)
         
-        script = "-- Data Load Script for SCMLex Hypergraph\n\n"
-        script += "BEGIN;\n\n"
+        script = io.StringIO()
+        script.write("-- Data Load Script for SCMLex Hypergraph\n\n")
+        script.write("BEGIN;\n\n")
         
-        # Load principles
-        script += "-- Load Level 1 Principles\n"
-        for principle in data['nodes']['principles']:
-            domains_array = "{" + ",".join(f'"{d}"' for d in principle.get('domains', [])) + "}"
-            script += f"""
-INSERT INTO scmlex_nodes (node_id, node_type, level, name, description, domains, confidence, provenance, inference_type, application_context)
-VALUES (
-    '{principle['node_id']}',
-    'principle',
-    1,
-    '{principle.get('name', '').replace("'", "''")}',
-    '{principle.get('description', '').replace("'", "''")}',
-    ARRAY{domains_array},
-    {principle.get('confidence', 1.0)},
-    '{principle.get('provenance', '').replace("'", "''")}',
-    '{principle.get('inference_type', '')}',
-    '{principle.get('application_context', '').replace("'", "''")}'
-) ON CONFLICT (node_id) DO NOTHING;
-"""
+        # Load principles through a single COPY block
+        script.write("-- Load Level 1 Principles\n")
+        script.write(_CREATE_STAGING + "\n\n")
+        script.write(_COPY_STAGING + ";\n")
+        script.writelines(_principle_copy_lines(data['nodes']['principles']))
+        script.write("\\.\n\n")
+        script.write(_MERGE_STAGING + "\n")
+        
+        script.write("\nCOMMIT;\n")
+        return script.getvalue()
+    
+    def load_via_copy(self, conn, tuples_file: str) -> int:
+        """Stream principles over COPY FROM STDIN on an open psycopg2 connection
+        
+        Runs in the connection's current transaction and commits it.
+        Returns the number of principles inserted.
+        """
+        data = _load_tuples(tuples_file)
+        
+        with conn.cursor() as cursor:
+            inserted = self.copy_principles(cursor, data['nodes']['principles'])
+        conn.commit()
+        return inserted
+    
+    def copy_principles(self, cursor, principles: Iterable[Dict]) -> int:
+        """COPY principles into a staging table and merge them into scmlex_nodes
         
-        script += "\nCOMMIT;\n"
-        return script
+        Does not commit. Rows whose (node_id, node_type) already exists are skipped.
+        Returns the number of principles inserted.
+        """
+        # copy_expert pulls fixed-size blocks, so rows are encoded as COPY reads
+        # them and a streamed principles iterable is never held in memory
+        buffer = _LineReader(_principle_copy_lines(principles))
+        cursor.execute(_CREATE_STAGING)
+        cursor.copy_expert(_COPY_STAGING, buffer)
+        cursor.execute(_MERGE_STAGING)
+        return cursor.rowcount
+    
+    def load_data(self, conn, tuples_file: str, page_size: int = 500) -> int:
+        """Insert principles with one prepared INSERT driven by execute_batch
+        
+        Values are sent as bind parameters rather than interpolated SQL text.
+        Returns the number of principles submitted.
+        """
+        if execute_batch is None:
+            raise ImportError("psycopg2 is required for load_data. Install with: pip install psycopg2-binary")
+        
+        data = _load_tuples(tuples_file)
+        rows = list(_principle_rows(data['nodes']['principles']))
+        with conn.cursor() as cursor:
+            execute_batch(cursor, _INSERT_PRINCIPLE, rows, page_size=page_size)
+        conn.commit()
+        return len(rows)
     
     def export_schema(self, output_file: str):
-        """Export schema to SQL file"""
+        """Export schema to SQL file, plus its pre-load and post-load halves alongside"""
         schema = self.generate_schema()
         with open(output_file, 'w') as f:
             f.write(schema)
         print(f"✅ Schema exported to: {output_file}")
+        
+        output_path = Path(output_file)
+        for suffix, part in (('pre', self.generate_schema_pre_load()),
+                             ('post', self.generate_schema_post_load())):
+            part_file = output_path.with_name(f"{output_path.stem}_{suffix}{output_path.suffix}")
+            with open(part_file, 'w') as f:
+                f.write(part)
+            print(f"✅ Schema ({suffix}-load) exported to: {part_file}")
     
     def export_sample_queries(self, output_file: str):
         """Export sample queries to SQL file"""
@@ -474,6 +744,23 @@ JOIN scmlex_nodes r ON e2.target_node_id = r.node_id
 WHERE p.node_type = 'principle'
     AND r.node_type = 'rule'
 LIMIT 10;
+
+-- 16. Substring and fuzzy name lookups (served by the trigram indexes)
+SELECT node_type, name
+FROM scmlex_nodes
+WHERE name ILIKE '%contract%';
+
+SELECT name, similarity(name, 'pakta-sunt-servanda') as score
+FROM scmlex_nodes
+WHERE name % 'pakta-sunt-servanda'
+ORDER BY score DESC
+LIMIT 10;
+
+-- 17. Derivations whose rule mentions "contract" (filters on the stored search_vec)
+SELECT principle_name, rule_name, jurisdiction, legal_domain
+FROM v_principle_rule_derivations
+WHERE rule_search_vec @@ plainto_tsquery('english', 'contract')
+LIMIT 10;
 """
         with open(output_file, 'w') as f:
             f.write(queries)
@@ -519,6 +806,28 @@ Or use the Supabase SQL Editor to execute the schema.
 
 Use the Python script or manual SQL inserts to load the hypergraph data.
 
+For large bulk loads, split the schema around the load so indexes are built
+once over the final tables (pre → COPY → post):
+
+```bash
+psql -h your-host -U your-user -d your-database -f schema_pre.sql
+psql -h your-host -U your-user -d your-database -f load_data.sql  # from generate_data_load_script()
+psql -h your-host -U your-user -d your-database -f schema_post.sql
+```
+
+`scmlex_nodes` is partitioned by `node_type`. A database created by an older,
+unpartitioned schema needs a one-time migration before loading: its
+`UNIQUE (node_id)` constraint does not match the loaders'
+`ON CONFLICT (node_id, node_type)`, so every insert fails. See the README in the
+`database/` directory.
+
+`v_hypergraph_statistics` is a materialized view. After loading data into an
+already-initialized schema, refresh it:
+
+```sql
+REFRESH MATERIALIZED VIEW CONCURRENTLY v_hypergraph_statistics;
+```
+
 ### 4. Run Sample Queries
 
 ```bash
@@ -536,7 +845,7 @@ psql -h your-host -U your-user -d your-database -f sample_queries.sql
 - `v_level1_principles` - All Level 1 principles
 - `v_rules_by_jurisdiction` - Rules grouped by jurisdiction
 - `v_principle_rule_derivations` - Principle-to-rule derivations
-- `v_hypergraph_statistics` - Overall statistics
+- `v_hypergraph_statistics` - Overall statistics (materialized; refresh after loads)
 """
     
     with open(output_dir / "README.md", 'w') as f:
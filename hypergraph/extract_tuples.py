@@ -12,12 +12,90 @@ This script parses all Scheme (.scm) files in the ChainLex repository and extrac
 Output: JSON file with all extracted tuples ready for hypergraph construction
 """
 
+import os
 import re
 import json
 import uuid
 from pathlib import Path
-from typing import Dict, List, Tuple, Set
-from collections import defaultdict
+from typing import Dict, List, Tuple, Set, Pattern, Optional
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Pattern to match principle definitions
+# (define principle-name
+#   (make-principle
+#    'name 'principle-name
+#    'description "..."
+#    ...))
+_PRINCIPLE_DEFN_RE = re.compile(r'\(define\s+([a-z\-]+)\s+\(make-principle\s+(.*?)\)\)', re.DOTALL)
+
+# make-principle attributes, matched in a single sweep: 'attr followed by a
+# symbol ('sym), a string ("str") or a list ('(lst))
+_PRINCIPLE_ATTR_RE = re.compile(
+    r"'(?P<attr>name|description|domain|provenance|related-principles|inference-type|application-context)\s+"
+    r"(?:'(?P<sym>[a-z\-]+)|\"(?P<str>[^\"]+)\"|'?\((?P<lst>[^\)]+)\))"
+)
+
+# Kind of value each make-principle attribute takes
+_PRINCIPLE_ATTR_KINDS = {
+    'name': 'sym',
+    'description': 'str',
+    'domain': 'lst',
+    'provenance': 'str',
+    'related-principles': 'lst',
+    'inference-type': 'sym',
+    'application-context': 'str'
+}
+
+# Pattern to match function definitions in a single pass
+# (define function-name (lambda (args) body))
+# or
+# (define (function-name args) body)
+_RULE_DEFN_RE = re.compile(
+    r'\(define\s+(?:'
+    r'(?P<lambda_name>[a-z\-\?]+)\s+\(lambda\s+\((?P<lambda_args>[^\)]*)\)\s+(?P<lambda_body>.*?)\)\)'
+    r'|\((?P<defun_name>[a-z\-\?]+)\s+(?P<defun_args>[^\)]*)\)\s+(?P<defun_body>.*?)\n\))',
+    re.DOTALL
+)
+
+_CROSS_REFERENCE_RE = re.compile(r'Cross-reference:\s*([a-z\-,\s]+)', re.IGNORECASE)
+
+# Characters either side of a definition searched for its docstring
+DOCSTRING_WINDOW = 500
+
+@lru_cache(maxsize=None)
+def _docstring_patterns(func_name: str) -> Tuple[Pattern, Pattern]:
+    """Compile the comment and string-literal docstring patterns for a function name"""
+    name = re.escape(func_name)
+    return (re.compile(r';;\s*' + name + r'[^\n]*\n;;\s*([^\n]+)'),
+            re.compile(r'\(define[^\n]*' + name + r'[^\n]*\n\s*"([^"]+)"'))
+
+def _rule_definitions(content: str) -> List[Tuple[str, str, str, int]]:
+    """Scan content once for (name, args, body, offset) of every rule definition
+    
+    Lambda-style definitions are listed before (define (name args) ...) ones,
+    matching the order the two forms were originally extracted in.
+    """
+    lambdas = []
+    defuns = []
+    for match in _RULE_DEFN_RE.finditer(content):
+        if match.group('lambda_name') is not None:
+            lambdas.append((match.group('lambda_name'), match.group('lambda_args'),
+                            match.group('lambda_body'), match.start()))
+        else:
+            defuns.append((match.group('defun_name'), match.group('defun_args'),
+                           match.group('defun_body'), match.start()))
+    return lambdas + defuns
 
 class SchemeParser:
     """Parser for extracting legal entities and relations from Scheme files"""
@@ -30,9 +108,16 @@ class SchemeParser:
         self.domains = set()
         self.relationships = []
         self.derivations = []
+        self._principle_names: Tuple[str, ...] = ()  # Principle names in definition order
+        self._matcher = None  # Aho-Corasick automaton over principle names
         
-    def parse_all(self):
-        """Parse all Scheme files in the repository"""
+    def parse_all(self, max_workers: Optional[int] = None):
+        """Parse all Scheme files in the repository
+        
+        Jurisdiction files are independent, so they are parsed in a pool of
+        max_workers processes (one per CPU by default) and merged in file
+        order. Pass max_workers=1 to parse serially in this process.
+        """
         print("Parsing ChainLex repository...")
         
         # Parse Level 1 principles
@@ -41,13 +126,32 @@ class SchemeParser:
             print(f"Parsing Level 1: {known_laws_file}")
             self.parse_known_laws(known_laws_file)
         
+        # Collect jurisdiction-specific frameworks in one directory walk. The first step
+        # yields the repo root: files there are skipped, and pruning its directory list
+        # in place keeps the walk out of the excluded top-level directories.
+        scm_files = []
+        walk = os.walk(self.repo_path)
+        _, top_dirs, _ = next(walk, (None, [], []))
+        top_dirs[:] = [d for d in top_dirs if d not in ('lv1', 'hypergraph', '.git')]
+        for root, _, files in walk:
+            for name in files:
+                if name.endswith('.scm') and 'enhanced' not in name:  # Skip enhanced versions for now
+                    scm_files.append(Path(root) / name)
+        
         # Parse jurisdiction-specific frameworks
-        for domain_dir in self.repo_path.iterdir():
-            if domain_dir.is_dir() and domain_dir.name not in ['lv1', 'hypergraph', '.git']:
-                for scm_file in domain_dir.rglob("*.scm"):
-                    if 'enhanced' not in scm_file.name:  # Skip enhanced versions for now
-                        print(f"Parsing Level 2+: {scm_file}")
-                        self.parse_jurisdiction_file(scm_file)
+        if max_workers == 1 or len(scm_files) < 2:
+            for scm_file in scm_files:
+                print(f"Parsing Level 2+: {scm_file}")
+                self.parse_jurisdiction_file(scm_file)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                     initargs=(str(self.repo_path), self.principles)) as executor:
+                results = executor.map(_parse_file_in_worker, scm_files)
+                for scm_file, (rules, derivations, domains) in zip(scm_files, results):
+                    print(f"Parsing Level 2+: {scm_file}")
+                    self.rules.update(rules)
+                    self.derivations.extend(derivations)
+                    self.domains.update(domains)
         
         print(f"\nExtraction complete:")
         print(f"  Principles: {len(self.principles)}")
@@ -61,16 +165,7 @@ class SchemeParser:
         """Parse known_laws.scm to extract Level 1 principles"""
         content = file_path.read_text()
         
-        # Pattern to match principle definitions
-        # (define principle-name
-        #   (make-principle
-        #    'name 'principle-name
-        #    'description "..."
-        #    ...))
-        
-        pattern = r'\(define\s+([a-z\-]+)\s+\(make-principle\s+(.*?)\)\)'
-        
-        for match in re.finditer(pattern, content, re.DOTALL):
+        for match in _PRINCIPLE_DEFN_RE.finditer(content):
             principle_var = match.group(1)
             principle_body = match.group(2)
             
@@ -92,32 +187,28 @@ class SchemeParser:
                         'target_node': related,
                         'strength': 0.9
                     })
+        
+        self.build_principle_matcher()
     
     def parse_principle_body(self, var_name: str, body: str) -> Dict:
         """Parse the body of a make-principle call"""
         principle = {
-            'node_id': str(uuid.uuid4()),
+            # Derived from the definition name so the key is stable across re-extractions
+            'node_id': f"principle:{var_name}",
             'node_type': 'principle',
             'level': 1,
             'name': var_name,
             'confidence': 1.0
         }
         
-        # Extract attributes
-        attributes = {
-            'name': r"'name\s+'([a-z\-]+)",
-            'description': r"'description\s+\"([^\"]+)\"",
-            'domain': r"'domain\s+'?\(([^\)]+)\)",
-            'provenance': r"'provenance\s+\"([^\"]+)\"",
-            'related-principles': r"'related-principles\s+'?\(([^\)]+)\)",
-            'inference-type': r"'inference-type\s+'([a-z\-]+)",
-            'application-context': r"'application-context\s+\"([^\"]+)\""
-        }
-        
-        for attr, pattern in attributes.items():
-            match = re.search(pattern, body)
-            if match:
-                value = match.group(1).strip()
+        # Extract attributes, keeping the first value of the expected kind for each
+        seen = set()
+        for match in _PRINCIPLE_ATTR_RE.finditer(body):
+            attr = match.group('attr')
+            value = match.group(_PRINCIPLE_ATTR_KINDS[attr])
+            if value is not None and attr not in seen:
+                seen.add(attr)
+                value = value.strip()
                 
                 if attr == 'domain':
                     # Parse list of domains
@@ -162,90 +253,106 @@ class SchemeParser:
         legal_domain = domain_mapping.get(domain_code, domain_code)
         self.domains.add(legal_domain)
         
-        # Pattern to match function definitions
-        # (define function-name (lambda (args) body))
-        # or
-        # (define (function-name args) body)
-        
-        pattern1 = r'\(define\s+([a-z\-\?]+)\s+\(lambda\s+\(([^\)]*)\)\s+(.*?)\)\)'
-        pattern2 = r'\(define\s+\(([a-z\-\?]+)\s+([^\)]*)\)\s+(.*?)\n\)'
-        
-        for pattern in [pattern1, pattern2]:
-            for match in re.finditer(pattern, content, re.DOTALL):
-                func_name = match.group(1)
-                func_args = match.group(2)
-                func_body = match.group(3)
-                
-                # Look for docstring (comment before or after definition)
-                docstring = self.extract_docstring(content, func_name)
-                
-                # Extract cross-references to Level 1 principles
-                cross_refs = self.extract_cross_references(func_body, docstring)
-                
-                rule = {
-                    'node_id': str(uuid.uuid4()),
-                    'node_type': 'rule',
-                    'level': 2,
-                    'name': func_name,
-                    'description': docstring or f"Rule: {func_name}",
-                    'jurisdiction': jurisdiction,
-                    'legal_domain': legal_domain,
-                    'confidence': 0.95,
-                    'derived_from': cross_refs,
+        for func_name, func_args, func_body, position in _rule_definitions(content):
+            # Look for docstring (comment before or after definition)
+            docstring = self.extract_docstring(content, func_name, position)
+            
+            # Extract cross-references to Level 1 principles
+            cross_refs = self.extract_cross_references(func_body, docstring)
+            
+            rule = {
+                'node_id': str(uuid.uuid4()),
+                'node_type': 'rule',
+                'level': 2,
+                'name': func_name,
+                'description': docstring or f"Rule: {func_name}",
+                'jurisdiction': jurisdiction,
+                'legal_domain': legal_domain,
+                'confidence': 0.95,
+                'derived_from': cross_refs,
+                'inference_type': 'deductive',
+                'implementation': f"(define ({func_name} {func_args}) ...)"
+            }
+            
+            self.rules[rule['node_id']] = rule
+            
+            # Create derivation hyperedges
+            if cross_refs:
+                self.derivations.append({
+                    'hyperedge_id': str(uuid.uuid4()),
+                    'hyperedge_type': 'derivation',
+                    'source_nodes': cross_refs,
+                    'target_node': rule['node_id'],
                     'inference_type': 'deductive',
-                    'implementation': f"(define ({func_name} {func_args}) ...)"
-                }
-                
-                self.rules[rule['node_id']] = rule
-                
-                # Create derivation hyperedges
-                if cross_refs:
-                    self.derivations.append({
-                        'hyperedge_id': str(uuid.uuid4()),
-                        'hyperedge_type': 'derivation',
-                        'source_nodes': cross_refs,
-                        'target_node': rule['node_id'],
-                        'inference_type': 'deductive',
-                        'confidence_impact': 0.95,
-                        'description': f"{func_name} derives from Level 1 principles"
-                    })
+                    'confidence_impact': 0.95,
+                    'description': f"{func_name} derives from Level 1 principles"
+                })
     
-    def extract_docstring(self, content: str, func_name: str) -> str:
-        """Extract docstring for a function"""
+    def extract_docstring(self, content: str, func_name: str, position: Optional[int] = None) -> str:
+        """Extract docstring for a function
+        
+        When position (the offset of the definition) is given, comments are
+        only searched for in the DOCSTRING_WINDOW characters before it and
+        string literals in the window starting at it.
+        """
+        comment_pattern, literal_pattern = _docstring_patterns(func_name)
+        if position is None:
+            before = after = content
+        else:
+            before = content[max(0, position - DOCSTRING_WINDOW):position]
+            after = content[position:position + DOCSTRING_WINDOW]
+        
         # Look for comment with function name
-        pattern = rf';;\s*{func_name}[^\n]*\n;;\s*([^\n]+)'
-        match = re.search(pattern, content)
+        match = comment_pattern.search(before)
         if match:
             return match.group(1).strip()
         
         # Look for string literal after definition
-        pattern = rf'\(define.*{func_name}.*\n\s*"([^"]+)"'
-        match = re.search(pattern, content, re.DOTALL)
+        match = literal_pattern.search(after)
         if match:
             return match.group(1).strip()
         
         return ""
     
+    def build_principle_matcher(self):
+        """Cache the principle names and compile them into an Aho-Corasick automaton
+        
+        The automaton is only built when pyahocorasick is installed.
+        """
+        self._principle_names = tuple(dict.fromkeys(
+            p['name'] for p in self.principles.values() if p.get('name')))
+        if ahocorasick is None or not self._principle_names:
+            self._matcher = None
+            return
+        
+        matcher = ahocorasick.Automaton()
+        for name in self._principle_names:
+            matcher.add_word(name, name)
+        matcher.make_automaton()
+        self._matcher = matcher
+    
     def extract_cross_references(self, func_body: str, docstring: str) -> List[str]:
         """Extract cross-references to Level 1 principles"""
-        cross_refs = []
+        # Insertion-ordered dict: O(1) dedupe while keeping first-seen order
+        cross_refs = {}
         
         # Look for "Cross-reference:" in docstring
         if docstring:
-            pattern = r'Cross-reference:\s*([a-z\-,\s]+)'
-            match = re.search(pattern, docstring, re.IGNORECASE)
+            match = _CROSS_REFERENCE_RE.search(docstring)
             if match:
                 refs = match.group(1)
-                cross_refs = [r.strip() for r in refs.split(',') if r.strip()]
+                cross_refs = dict.fromkeys(r.strip() for r in refs.split(',') if r.strip())
         
-        # Look for principle names in function body
-        for principle_name in self.principles.values():
-            name = principle_name.get('name', '')
-            if name and name in func_body:
-                if name not in cross_refs:
-                    cross_refs.append(name)
+        # Look for principle names in function body: one automaton pass when available,
+        # then report hits in principle order so the output matches the plain scan
+        haystack = func_body
+        if self._matcher is not None:
+            haystack = {name for _, name in self._matcher.iter(func_body)}
+        for name in self._principle_names:
+            if name in haystack:
+                cross_refs[name] = None
         
-        return cross_refs
+        return list(cross_refs)
     
     def export_to_json(self, output_path: str):
         """Export all extracted data to JSON"""
@@ -281,12 +388,33 @@ class SchemeParser:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(data, f, indent=2)
         
         print(f"\nExported to: {output_file}")
         print(f"File size: {output_file.stat().st_size / 1024:.2f} KB")
 
+# Per-process parser used by parse_all's worker pool
+_worker_parser = None
+
+def _init_worker(repo_path: str, principles: Dict):
+    """Give each worker process its own parser seeded with the Level 1 principles"""
+    global _worker_parser
+    _worker_parser = SchemeParser(repo_path)
+    _worker_parser.principles = principles
+    _worker_parser.build_principle_matcher()
+
+def _parse_file_in_worker(file_path: Path) -> Tuple[Dict, List, Set]:
+    """Parse one jurisdiction file in a worker and return its rules, derivations and domains"""
+    parser = _worker_parser
+    parser.rules, parser.derivations, parser.domains = {}, [], set()
+    parser.parse_jurisdiction_file(file_path)
+    return parser.rules, parser.derivations, parser.domains
+
 def main():
     """Main execution"""
     import sys
@@ -11,65 +11,300 @@ Provides sophisticated query capabilities for legal reasoning:
 6. Domain-specific queries
 """
 
+import gc
+import os
+import sys
 import pickle
 import json
-import networkx as nx
-from pathlib import Path
-from typing import List, Dict, Any, Optional, Set, Tuple
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 from collections import defaultdict
 
+# Separator between records in the keyword-search text blobs
+SEARCH_SEPARATOR = '\x00'
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@lru_cache(maxsize=4)
+def _load_hypergraph(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Unpickle a hypergraph bundle; cached per (path, mtime)"""
+    # The pickle is one large tree of containers; pausing the cyclic GC
+    # stops it from repeatedly traversing them while they are created
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    finally:
+        if was_enabled:
+            gc.enable()
+
+def load_hypergraph(hypergraph_file: str) -> Dict[str, Any]:
+    """Load a hypergraph pickle, reusing the last load while the file is unchanged.
+    
+    The returned bundle is shared between callers and must not be mutated.
+    """
+    path = os.path.abspath(hypergraph_file)
+    return _load_hypergraph(path, os.stat(path).st_mtime_ns)
+
+# Query results. Use dataclasses.asdict() where a plain dict is needed, e.g. for JSON.
+
+@dataclass(slots=True)
+class PrincipleHit:
+    id: str
+    name: str
+    description: str
+    confidence: float
+    domains: List[str]
+
+@dataclass(slots=True)
+class RuleHit:
+    id: str
+    name: str
+    description: str
+    jurisdiction: str
+    legal_domain: str
+    confidence: float
+
+@dataclass(slots=True)
+class DerivedRule:
+    id: str
+    name: str
+    description: str
+    jurisdiction: str
+    legal_domain: str
+    confidence: float
+    inference_type: str
+
+@dataclass(slots=True)
+class RelatedPrinciple:
+    id: str
+    name: str
+    description: str
+    relationship: str
+    strength: float
+
+@dataclass(slots=True)
+class PrincipleDetails:
+    id: str
+    name: str
+    description: str
+    domains: List[str]
+    confidence: float
+    provenance: str
+    inference_type: str
+    application_context: str
+
+@dataclass(slots=True)
+class RuleDetails:
+    id: str
+    name: str
+    description: str
+    jurisdiction: str
+    legal_domain: str
+    confidence: float
+    level: int
+    derived_from: List[str]
+    inference_type: str
+
+@dataclass(slots=True)
+class KeywordHit:
+    id: str
+    type: str
+    name: str
+    description: str
+    relevance: str
+
 class HypergraphQuery:
     """Query interface for SCMLex Hypergraph"""
     
     def __init__(self, hypergraph_file: str):
         """Load hypergraph from pickle file"""
         print(f"Loading hypergraph from {hypergraph_file}...")
-        with open(hypergraph_file, 'rb') as f:
-            data = pickle.load(f)
+        data = load_hypergraph(hypergraph_file)
         
         self.graph = data['graph']
         self.hyperedges = data['hyperedges']
         self.node_index = data['node_index']
         self.stats = data['stats']
         
+        # Resolve the graph flavour once; a MultiDiGraph keys parallel edges
+        # under each (u, v), so hops take the first of them
+        self._is_multi = self.graph.is_multigraph()
+        adj = self.graph.adj
+        if self._is_multi:
+            self._edge_getter = lambda u, v: next(iter(adj[u][v].values()))
+        else:
+            self._edge_getter = lambda u, v: adj[u][v]
+        
+        self._build_indices()
+        self._build_csr()
+        
         print(f"✅ Loaded: {self.graph.number_of_nodes()} nodes, {self.graph.number_of_edges()} edges")
     
-    def find_principles_by_domain(self, domain: str) -> List[Dict]:
-        """Find all Level 1 principles applicable to a domain"""
-        results = []
+    def _build_indices(self):
+        """Build inverted indices over node attributes in a single pass.
+        
+        Queries look up candidate node IDs here instead of scanning every
+        node in the graph. Index lists preserve graph node order.
+        """
+        self._by_domain = defaultdict(list)      # principle domain -> ids
+        self._by_jur = defaultdict(list)         # upper-cased jurisdiction -> rule ids
+        self._by_type = defaultdict(list)        # node_type -> ids
+        self._by_type_domain = defaultdict(list) # (node_type, legal_domain) -> ids
+        self._domains = {}                       # principle id -> tuple of domains
+        
+        # Parallel flat lists for keyword search, lowercased once here
+        self._search_ids = []
+        self._search_types = []
+        self._search_names = []
+        self._search_descs = []
+        
         for node_id, data in self.graph.nodes(data=True):
-            if data.get('node_type') == 'principle':
+            node_type = data.get('node_type')
+            self._by_type[node_type].append(node_id)
+            
+            self._search_ids.append(node_id)
+            self._search_types.append(node_type)
+            self._search_names.append((data.get('name') or '').lower())
+            self._search_descs.append((data.get('description') or '').lower())
+            
+            if node_type == 'principle':
                 domains = data.get('domains', [])
                 if isinstance(domains, str):
                     domains = domains.split(',')
-                if domain in domains:
-                    results.append({
-                        'id': node_id,
-                        'name': data.get('name', ''),
-                        'description': data.get('description', ''),
-                        'confidence': data.get('confidence', 1.0),
-                        'domains': domains
-                    })
+                domains = tuple(map(sys.intern, domains or ()))
+                self._domains[node_id] = domains
+                for domain in dict.fromkeys(domains):
+                    self._by_domain[domain].append(node_id)
+            elif node_type == 'rule':
+                jurisdiction = data.get('jurisdiction', '') or ''
+                self._by_jur[jurisdiction.upper()].append(node_id)
+            
+            self._by_type_domain[(node_type, data.get('legal_domain'))].append(node_id)
+        
+        # One blob per searched field, with the start offset of every record
+        self._name_blob, self._name_starts = self._build_blob(self._search_names)
+        self._desc_blob, self._desc_starts = self._build_blob(self._search_descs)
+    
+    @staticmethod
+    def _build_blob(texts: List[str]) -> Tuple[str, array]:
+        """Join texts with SEARCH_SEPARATOR and record each one's start offset"""
+        starts = array('l')
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        return SEARCH_SEPARATOR.join(texts), starts
+    
+    @staticmethod
+    def _scan_blob(blob: str, starts: array, texts: List[str], keyword: str) -> List[int]:
+        """Return the indices of the records in blob that contain keyword"""
+        if SEARCH_SEPARATOR in keyword:
+            # A match could straddle records; check them one by one
+            return [i for i, text in enumerate(texts) if keyword in text]
+        
+        hits = []
+        count = len(starts)
+        pos = 0
+        while count:
+            offset = blob.find(keyword, pos)
+            if offset < 0:
+                break
+            i = bisect_right(starts, offset) - 1
+            hits.append(i)
+            # Skip the rest of this record
+            if i + 1 >= count:
+                break
+            pos = starts[i + 1]
+        return hits
+    
+    def _build_csr(self):
+        """Flatten the out-adjacency into compressed sparse row arrays.
+        
+        Nodes are numbered in graph order. The out-edges of node i occupy
+        positions _indptr[i]:_indptr[i+1] of _indices (target positions),
+        _edge_types and _edge_attrs, in the same order as out_edges().
+        """
+        self._node_ids = list(self.graph.nodes())
+        self._node_pos = {node_id: i for i, node_id in enumerate(self._node_ids)}
+        
+        indptr = array('l', [0])
+        indices = array('l')
+        edge_types = []
+        edge_attrs = []
+        
+        pos = self._node_pos
+        adj = self.graph.adj
+        multigraph = self._is_multi
+        for node_id in self._node_ids:
+            for target, edges in adj[node_id].items():
+                target_pos = pos[target]
+                for data in (edges.values() if multigraph else (edges,)):
+                    indices.append(target_pos)
+                    edge_types.append(data.get('edge_type'))
+                    edge_attrs.append(data)
+            indptr.append(len(indices))
+        
+        self._indptr = indptr
+        self._indices = indices
+        self._edge_types = edge_types
+        self._edge_attrs = edge_attrs
+    
+    def _out_edges_of_type(self, node_id: str, edge_type: str) -> Iterator[Tuple[str, Dict]]:
+        """Yield (target_id, edge_data) for out-edges of node_id with the given type"""
+        i = self._node_pos[node_id]
+        node_ids = self._node_ids
+        indices = self._indices
+        edge_types = self._edge_types
+        edge_attrs = self._edge_attrs
+        for e in range(self._indptr[i], self._indptr[i + 1]):
+            if edge_types[e] == edge_type:
+                yield node_ids[indices[e]], edge_attrs[e]
+    
+    def find_principles_by_domain(self, domain: str) -> List[PrincipleHit]:
+        """Find all Level 1 principles applicable to a domain"""
+        results = []
+        nodes = self.graph.nodes
+        for node_id in self._by_domain.get(domain, ()):
+            data = nodes[node_id]
+            results.append(PrincipleHit(
+                node_id,
+                data.get('name', ''),
+                data.get('description', ''),
+                data.get('confidence', 1.0),
+                list(self._domains[node_id])
+            ))
         return results
     
-    def find_rules_by_jurisdiction(self, jurisdiction: str, domain: Optional[str] = None) -> List[Dict]:
+    def find_rules_by_jurisdiction(self, jurisdiction: str, domain: Optional[str] = None) -> List[RuleHit]:
         """Find all rules for a specific jurisdiction and optionally domain"""
+        node_ids = self._by_jur.get(jurisdiction.upper(), [])
+        if domain is not None:
+            in_domain = set(self._by_type_domain.get(('rule', domain), ()))
+            node_ids = [node_id for node_id in node_ids if node_id in in_domain]
+        
         results = []
-        for node_id, data in self.graph.nodes(data=True):
-            if data.get('node_type') == 'rule':
-                if data.get('jurisdiction', '').upper() == jurisdiction.upper():
-                    if domain is None or data.get('legal_domain') == domain:
-                        results.append({
-                            'id': node_id,
-                            'name': data.get('name', ''),
-                            'description': data.get('description', ''),
-                            'jurisdiction': data.get('jurisdiction', ''),
-                            'legal_domain': data.get('legal_domain', ''),
-                            'confidence': data.get('confidence', 0.95)
-                        })
+        nodes = self.graph.nodes
+        for node_id in node_ids:
+            data = nodes[node_id]
+            results.append(RuleHit(
+                node_id,
+                data.get('name', ''),
+                data.get('description', ''),
+                data.get('jurisdiction', ''),
+                data.get('legal_domain', ''),
+                data.get('confidence', 0.95)
+            ))
         return results
     
-    def find_rules_derived_from_principle(self, principle_name: str) -> List[Dict]:
+    def find_rules_derived_from_principle(self, principle_name: str) -> List[DerivedRule]:
         """Find all rules derived from a specific principle"""
         # Get principle node ID
         principle_id = self.node_index.get(principle_name)
@@ -78,21 +313,20 @@ class HypergraphQuery:
         
         results = []
         # Find all outgoing derivation edges
-        for _, target, data in self.graph.out_edges(principle_id, data=True):
-            if data.get('edge_type') == 'derivation':
-                target_data = self.graph.nodes[target]
-                results.append({
-                    'id': target,
-                    'name': target_data.get('name', ''),
-                    'description': target_data.get('description', ''),
-                    'jurisdiction': target_data.get('jurisdiction', ''),
-                    'legal_domain': target_data.get('legal_domain', ''),
-                    'confidence': target_data.get('confidence', 0.95),
-                    'inference_type': data.get('inference_type', 'deductive')
-                })
+        for target, data in self._out_edges_of_type(principle_id, 'derivation'):
+            target_data = self.graph.nodes[target]
+            results.append(DerivedRule(
+                target,
+                target_data.get('name', ''),
+                target_data.get('description', ''),
+                target_data.get('jurisdiction', ''),
+                target_data.get('legal_domain', ''),
+                target_data.get('confidence', 0.95),
+                data.get('inference_type', 'deductive')
+            ))
         return results
     
-    def find_related_principles(self, principle_name: str) -> List[Dict]:
+    def find_related_principles(self, principle_name: str) -> List[RelatedPrinciple]:
         """Find all principles related to a given principle"""
         principle_id = self.node_index.get(principle_name)
         if not principle_id:
@@ -100,17 +334,16 @@ class HypergraphQuery:
         
         results = []
         # Find all relationship edges
-        for _, target, data in self.graph.out_edges(principle_id, data=True):
-            if data.get('edge_type') == 'relationship':
-                target_data = self.graph.nodes[target]
-                if target_data.get('node_type') == 'principle':
-                    results.append({
-                        'id': target,
-                        'name': target_data.get('name', ''),
-                        'description': target_data.get('description', ''),
-                        'relationship': data.get('relationship_name', 'related-to'),
-                        'strength': data.get('strength', 0.9)
-                    })
+        for target, data in self._out_edges_of_type(principle_id, 'relationship'):
+            target_data = self.graph.nodes[target]
+            if target_data.get('node_type') == 'principle':
+                results.append(RelatedPrinciple(
+                    target,
+                    target_data.get('name', ''),
+                    target_data.get('description', ''),
+                    data.get('relationship_name', 'related-to'),
+                    data.get('strength', 0.9)
+                ))
         return results
     
     def build_inference_chain(self, start_principle: str, end_rule: str) -> Optional[List[Dict]]:
@@ -121,41 +354,67 @@ class HypergraphQuery:
         if not start_id or not end_id:
             return None
         
-        try:
-            # Find shortest path
-            path = nx.shortest_path(self.graph, start_id, end_id)
+        # Find shortest path
+        path = self._shortest_path(start_id, end_id)
+        if path is None:
+            return None
+        
+        # Build chain with details
+        chain = []
+        for i, node_id in enumerate(path):
+            node_data = self.graph.nodes[node_id]
+            chain_item = {
+                'step': i + 1,
+                'id': node_id,
+                'name': node_data.get('name', ''),
+                'type': node_data.get('node_type', ''),
+                'level': node_data.get('level', 0),
+                'confidence': node_data.get('confidence', 1.0)
+            }
             
-            # Build chain with details
-            chain = []
-            for i, node_id in enumerate(path):
-                node_data = self.graph.nodes[node_id]
-                chain_item = {
-                    'step': i + 1,
-                    'id': node_id,
-                    'name': node_data.get('name', ''),
-                    'type': node_data.get('node_type', ''),
-                    'level': node_data.get('level', 0),
-                    'confidence': node_data.get('confidence', 1.0)
+            # Add edge information if not the last node
+            if i < len(path) - 1:
+                edge_data = self._edge_getter(node_id, path[i+1])
+                chain_item['edge_to_next'] = {
+                    'type': edge_data.get('edge_type', ''),
+                    'inference_type': edge_data.get('inference_type', ''),
+                    'confidence_impact': edge_data.get('confidence_impact', 1.0)
                 }
-                
-                # Add edge information if not the last node
-                if i < len(path) - 1:
-                    edge_data = self.graph.get_edge_data(node_id, path[i+1])
-                    if edge_data:
-                        # Handle MultiDiGraph - get first edge
-                        if isinstance(edge_data, dict) and 0 in edge_data:
-                            edge_data = edge_data[0]
-                        chain_item['edge_to_next'] = {
-                            'type': edge_data.get('edge_type', ''),
-                            'inference_type': edge_data.get('inference_type', ''),
-                            'confidence_impact': edge_data.get('confidence_impact', 1.0)
-                        }
-                
-                chain.append(chain_item)
             
-            return chain
-        except nx.NetworkXNoPath:
+            chain.append(chain_item)
+        
+        return chain
+    
+    def _shortest_path(self, start_id: str, end_id: str) -> Optional[List[str]]:
+        """Unweighted shortest path over the CSR arrays, or None if unreachable"""
+        src = self._node_pos[start_id]
+        dst = self._node_pos[end_id]
+        indptr = self._indptr
+        indices = self._indices
+        
+        # Level-by-level BFS recording each node's predecessor
+        pred = {src: -1}
+        frontier = [src]
+        while frontier and dst not in pred:
+            next_frontier = []
+            for u in frontier:
+                for e in range(indptr[u], indptr[u + 1]):
+                    v = indices[e]
+                    if v not in pred:
+                        pred[v] = u
+                        next_frontier.append(v)
+            frontier = next_frontier
+        
+        if dst not in pred:
             return None
+        
+        path = []
+        node = dst
+        while node != -1:
+            path.append(self._node_ids[node])
+            node = pred[node]
+        path.reverse()
+        return path
     
     def compute_path_confidence(self, path: List[Dict]) -> float:
         """Compute cumulative confidence along an inference chain"""
@@ -174,82 +433,134 @@ class HypergraphQuery:
         if not start_id or not end_id:
             return []
         
-        try:
-            all_paths = []
-            for path in nx.all_simple_paths(self.graph, start_id, end_id, cutoff=max_length):
-                # Build detailed path
-                detailed_path = []
-                for i, node_id in enumerate(path):
-                    node_data = self.graph.nodes[node_id]
-                    detailed_path.append({
-                        'step': i + 1,
-                        'id': node_id,
-                        'name': node_data.get('name', ''),
-                        'type': node_data.get('node_type', ''),
-                        'confidence': node_data.get('confidence', 1.0)
-                    })
-                all_paths.append(detailed_path)
-            return all_paths
-        except nx.NetworkXNoPath:
-            return []
+        all_paths = []
+        node_ids = self._node_ids
+        for path in self._simple_paths(start_id, end_id, max_length):
+            # Build detailed path
+            detailed_path = []
+            for i, pos in enumerate(path):
+                node_id = node_ids[pos]
+                node_data = self.graph.nodes[node_id]
+                detailed_path.append({
+                    'step': i + 1,
+                    'id': node_id,
+                    'name': node_data.get('name', ''),
+                    'type': node_data.get('node_type', ''),
+                    'confidence': node_data.get('confidence', 1.0)
+                })
+            all_paths.append(detailed_path)
+        return all_paths
+    
+    def _simple_paths(self, start_id: str, end_id: str, cutoff: Optional[int]) -> Iterator[List[int]]:
+        """Yield simple paths of at most cutoff edges as lists of node positions.
+        
+        Iterative DFS over the CSR arrays that follows the same conventions
+        as nx.all_simple_paths: neighbours in adjacency order, and a path is
+        yielded once per parallel edge that completes it.
+        """
+        src = self._node_pos[start_id]
+        dst = self._node_pos[end_id]
+        if cutoff is None:
+            cutoff = len(self._node_ids) - 1
+        if cutoff < 0:
+            return
+        if src == dst:
+            yield [src]
+            return
+        if cutoff < 1:
+            return
+        
+        indptr = self._indptr
+        indices = self._indices
+        
+        # path[k] is entered from the edge before next_edge[k]; next_edge[k]
+        # is the next out-edge of path[k] still to be tried
+        path = [src]
+        next_edge = [indptr[src]]
+        on_path = {src}
+        while path:
+            u = path[-1]
+            e = next_edge[-1]
+            if e == indptr[u + 1]:
+                # Out-edges of u exhausted; backtrack
+                path.pop()
+                next_edge.pop()
+                on_path.discard(u)
+                continue
+            next_edge[-1] = e + 1
+            
+            v = indices[e]
+            if v in on_path:
+                continue
+            if v == dst:
+                yield path + [v]
+            elif len(path) < cutoff:
+                path.append(v)
+                next_edge.append(indptr[v])
+                on_path.add(v)
     
-    def get_principle_by_name(self, name: str) -> Optional[Dict]:
+    def get_principle_by_name(self, name: str) -> Optional[PrincipleDetails]:
         """Get full details of a principle by name"""
         node_id = self.node_index.get(name)
         if not node_id:
             return None
         
         data = self.graph.nodes[node_id]
-        return {
-            'id': node_id,
-            'name': data.get('name', ''),
-            'description': data.get('description', ''),
-            'domains': data.get('domains', []),
-            'confidence': data.get('confidence', 1.0),
-            'provenance': data.get('provenance', ''),
-            'inference_type': data.get('inference_type', ''),
-            'application_context': data.get('application_context', '')
-        }
+        return PrincipleDetails(
+            node_id,
+            data.get('name', ''),
+            data.get('description', ''),
+            data.get('domains', []),
+            data.get('confidence', 1.0),
+            data.get('provenance', ''),
+            data.get('inference_type', ''),
+            data.get('application_context', '')
+        )
     
-    def get_rule_by_name(self, name: str) -> Optional[Dict]:
+    def get_rule_by_name(self, name: str) -> Optional[RuleDetails]:
         """Get full details of a rule by name"""
         node_id = self.node_index.get(name)
         if not node_id:
             return None
         
         data = self.graph.nodes[node_id]
-        return {
-            'id': node_id,
-            'name': data.get('name', ''),
-            'description': data.get('description', ''),
-            'jurisdiction': data.get('jurisdiction', ''),
-            'legal_domain': data.get('legal_domain', ''),
-            'confidence': data.get('confidence', 0.95),
-            'level': data.get('level', 2),
-            'derived_from': data.get('derived_from', []),
-            'inference_type': data.get('inference_type', 'deductive')
-        }
+        return RuleDetails(
+            node_id,
+            data.get('name', ''),
+            data.get('description', ''),
+            data.get('jurisdiction', ''),
+            data.get('legal_domain', ''),
+            data.get('confidence', 0.95),
+            data.get('level', 2),
+            data.get('derived_from', []),
+            data.get('inference_type', 'deductive')
+        )
     
-    def search_by_keyword(self, keyword: str, node_type: Optional[str] = None) -> List[Dict]:
+    def search_by_keyword(self, keyword: str, node_type: Optional[str] = None) -> List[KeywordHit]:
         """Search for nodes by keyword in name or description"""
         keyword_lower = keyword.lower()
         results = []
+        nodes = self.graph.nodes
         
-        for node_id, data in self.graph.nodes(data=True):
-            if node_type and data.get('node_type') != node_type:
+        # Find matching records with one C-level find() sweep per field
+        name_hits = set(self._scan_blob(self._name_blob, self._name_starts,
+                                        self._search_names, keyword_lower))
+        desc_hits = self._scan_blob(self._desc_blob, self._desc_starts,
+                                    self._search_descs, keyword_lower)
+        
+        for i in sorted(name_hits.union(desc_hits)):
+            if node_type and self._search_types[i] != node_type:
                 continue
             
-            name = data.get('name', '').lower()
-            description = data.get('description', '').lower()
-            
-            if keyword_lower in name or keyword_lower in description:
-                results.append({
-                    'id': node_id,
-                    'type': data.get('node_type', ''),
-                    'name': data.get('name', ''),
-                    'description': data.get('description', ''),
-                    'relevance': 'name' if keyword_lower in name else 'description'
-                })
+            relevance = 'name' if i in name_hits else 'description'
+            data = nodes[self._search_ids[i]]
+            results.append(KeywordHit(
+                self._search_ids[i],
+                data.get('node_type', ''),
+                data.get('name', ''),
+                data.get('description', ''),
+                relevance
+            ))
         
         return results
     
@@ -258,19 +569,17 @@ class HypergraphQuery:
         principles = self.find_principles_by_domain(domain)
         
         # Count rules in this domain
-        rule_count = 0
-        jurisdictions = set()
-        for node_id, data in self.graph.nodes(data=True):
-            if data.get('node_type') == 'rule' and data.get('legal_domain') == domain:
-                rule_count += 1
-                jurisdictions.add(data.get('jurisdiction', ''))
+        rule_ids = self._by_type_domain.get(('rule', domain), ())
+        rule_count = len(rule_ids)
+        nodes = self.graph.nodes
+        jurisdictions = {nodes[node_id].get('jurisdiction', '') for node_id in rule_ids}
         
         return {
             'domain': domain,
             'principle_count': len(principles),
             'rule_count': rule_count,
             'jurisdictions': list(jurisdictions),
-            'principles': [p['name'] for p in principles]
+            'principles': [p.name for p in principles]
         }
     
     def export_subgraph(self, node_ids: List[str], output_file: str):
@@ -293,8 +602,12 @@ class HypergraphQuery:
             edge_dict['target'] = target
             data['edges'].append(edge_dict)
         
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(data, f, indent=2)
         
         print(f"✅ Subgraph exported to {output_file}")
 
@@ -314,35 +627,35 @@ def main():
     print("\n1. Principles in Contract Law:")
     principles = query.find_principles_by_domain('contract')
     for p in principles[:5]:
-        print(f"   - {p['name']}: {p['description'][:60]}...")
+        print(f"   - {p.name}: {p.description[:60]}...")
     print(f"   Total: {len(principles)} principles")
     
     # Query 2: Find South African civil law rules
     print("\n2. South African Civil Law Rules:")
     rules = query.find_rules_by_jurisdiction('ZA', 'civil')
     for r in rules[:5]:
-        print(f"   - {r['name']}: {r['description'][:60]}...")
+        print(f"   - {r.name}: {r.description[:60]}...")
     print(f"   Total: {len(rules)} rules")
     
     # Query 3: Find rules derived from pacta-sunt-servanda
     print("\n3. Rules derived from 'pacta-sunt-servanda':")
     derived = query.find_rules_derived_from_principle('pacta-sunt-servanda')
     for r in derived[:5]:
-        print(f"   - {r['name']} ({r['legal_domain']})")
+        print(f"   - {r.name} ({r.legal_domain})")
     print(f"   Total: {len(derived)} rules")
     
     # Query 4: Find related principles
     print("\n4. Principles related to 'pacta-sunt-servanda':")
     related = query.find_related_principles('pacta-sunt-servanda')
     for r in related[:5]:
-        print(f"   - {r['name']} (strength: {r['strength']})")
+        print(f"   - {r.name} (strength: {r.strength})")
     print(f"   Total: {len(related)} related principles")
     
     # Query 5: Search by keyword
     print("\n5. Search for 'contract':")
     search_results = query.search_by_keyword('contract', node_type='rule')
     for r in search_results[:5]:
-        print(f"   - {r['name']} ({r['type']})")
+        print(f"   - {r.name} ({r.type})")
     print(f"   Total: {len(search_results)} results")
     
     # Query 6: Domain statistics
@@ -9,14 +9,35 @@ Creates various visualizations:
 4. Statistical dashboards
 """
 
-import pickle
+import hashlib
+import multiprocessing
+import os
+import sys
 import json
 import networkx as nx
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # render straight to files; no interactive backend needed
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 from pathlib import Path
-from typing import List, Dict, Any
-from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from query_hypergraph import load_hypergraph
+
+# Principle network colors by primary domain; the last entry is "other"
+PRINCIPLE_PALETTE = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#95E1D3']
+PRINCIPLE_COLOR_DOMAINS = ['contract', 'criminal', 'civil']
+
+# spring_layout parameters for the principle network
+LAYOUT_PARAMS = {'k': 2, 'iterations': 50, 'seed': 42}
+
+# Computed network layouts, one JSON file per subgraph and parameter set
+LAYOUT_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'scmlex' / 'layouts'
 
 class HypergraphVisualizer:
     """Visualization tools for SCMLex Hypergraph"""
@@ -24,196 +45,135 @@ class HypergraphVisualizer:
     def __init__(self, hypergraph_file: str):
         """Load hypergraph from pickle file"""
         print(f"Loading hypergraph from {hypergraph_file}...")
-        with open(hypergraph_file, 'rb') as f:
-            data = pickle.load(f)
+        data = load_hypergraph(hypergraph_file)
         
         self.graph = data['graph']
         self.hyperedges = data['hyperedges']
         self.node_index = data['node_index']
         self.stats = data['stats']
         
+        self._build_partitions()
+        
         print(f"✅ Loaded: {self.graph.number_of_nodes()} nodes, {self.graph.number_of_edges()} edges")
     
-    def visualize_domain_distribution(self, output_file: str):
-        """Create bar chart of domain distribution"""
-        print(f"\nCreating domain distribution chart...")
-        
-        # Count nodes by domain
-        domain_counts = Counter()
+    def _build_partitions(self):
+        """Partition node IDs by type and level and precompute principle colors"""
+        self._nodes_by_type = defaultdict(list)
+        self._nodes_by_level = defaultdict(list)
+        self._color_index = {}
+        self._domains = {}  # node id -> tuple of stripped, interned domains
+        self._flat_domains = []  # every node's domains (or legal_domain), in node order
+        
+        other = len(PRINCIPLE_PALETTE) - 1
         for node_id, data in self.graph.nodes(data=True):
+            node_type = data.get('node_type')
+            self._nodes_by_type[node_type].append(node_id)
+            self._nodes_by_level[data.get('level')].append(node_id)
+            
             if 'domains' in data:
                 domains = data['domains']
                 if isinstance(domains, str):
                     domains = domains.split(',')
-                for domain in domains:
-                    domain_counts[domain.strip()] += 1
+                domains = tuple(sys.intern(domain.strip()) for domain in domains)
+                self._domains[node_id] = domains
+                self._flat_domains.extend(domains)
             elif 'legal_domain' in data:
-                domain_counts[data['legal_domain']] += 1
-        
-        # Get top 15 domains
-        top_domains = domain_counts.most_common(15)
-        domains = [d[0] for d in top_domains]
-        counts = [d[1] for d in top_domains]
-        
-        # Create chart
-        fig, ax = plt.subplots(figsize=(12, 8))
-        bars = ax.barh(domains, counts, color='steelblue')
-        
-        # Add value labels
-        for i, (bar, count) in enumerate(zip(bars, counts)):
-            ax.text(count + 5, i, str(count), va='center', fontsize=10)
-        
-        ax.set_xlabel('Number of Nodes', fontsize=12)
-        ax.set_ylabel('Legal Domain', fontsize=12)
-        ax.set_title('SCMLex Hypergraph: Domain Distribution', fontsize=14, fontweight='bold')
-        ax.grid(axis='x', alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
-        plt.close()
+                self._flat_domains.append(data['legal_domain'])
+            
+            if node_type == 'principle':
+                domains = self._domains.get(node_id, ())
+                color = other
+                for i, domain in enumerate(PRINCIPLE_COLOR_DOMAINS):
+                    if domain in domains:
+                        color = i
+                        break
+                self._color_index[node_id] = color
         
-        print(f"✅ Saved: {output_file}")
+        # Derivation targets per source, one entry per edge in out_edges order
+        self._derivations_from = defaultdict(list)
+        for source, target, edge_type in self.graph.edges(data='edge_type'):
+            if edge_type == 'derivation':
+                self._derivations_from[source].append(target)
     
-    def visualize_node_types(self, output_file: str):
-        """Create pie chart of node types"""
-        print(f"\nCreating node types chart...")
-        
-        node_types = self.stats.get('node_types', {})
-        
-        # Create pie chart
-        fig, ax = plt.subplots(figsize=(10, 8))
-        
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']
-        explode = [0.05 if v == max(node_types.values()) else 0 for v in node_types.values()]
-        
-        wedges, texts, autotexts = ax.pie(
-            node_types.values(),
-            labels=node_types.keys(),
-            autopct='%1.1f%%',
-            colors=colors,
-            explode=explode,
-            startangle=90,
-            textprops={'fontsize': 12}
-        )
-        
-        # Add count labels
-        for i, (label, count) in enumerate(node_types.items()):
-            texts[i].set_text(f'{label.capitalize()}\n({count})')
-        
-        ax.set_title('SCMLex Hypergraph: Node Type Distribution', 
-                    fontsize=14, fontweight='bold', pad=20)
-        
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        print(f"✅ Saved: {output_file}")
+    def _network_layout(self, subgraph) -> Dict[str, Tuple[float, float]]:
+        """Compute a spring layout, reusing a cached one for the same subgraph"""
+        # Key the cache on the networkx version, the layout parameters and the
+        # exact node/edge lists
+        digest = hashlib.sha1(f"spring {nx.__version__} {sorted(LAYOUT_PARAMS.items())}\n".encode())
+        for node in subgraph.nodes():
+            digest.update(f"n {node}\n".encode())
+        for source, target in subgraph.edges():
+            digest.update(f"e {source} {target}\n".encode())
+        cache_file = LAYOUT_CACHE_DIR / f"{digest.hexdigest()}.json"
+        
+        try:
+            with open(cache_file) as f:
+                return {node: tuple(xy) for node, xy in json.load(f).items()}
+        except (OSError, ValueError):
+            pass
+        
+        pos = nx.spring_layout(subgraph, **LAYOUT_PARAMS)
+        
+        # The cache is only an optimization; an unwritable cache dir is not an error
+        try:
+            LAYOUT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'w') as f:
+                json.dump({node: [float(x), float(y)] for node, (x, y) in pos.items()}, f)
+        except OSError:
+            pass
+        
+        return pos
     
-    def visualize_principle_network(self, output_file: str, max_nodes: int = 50):
-        """Create network diagram of principles and their relationships"""
-        print(f"\nCreating principle network diagram...")
-        
-        # Extract subgraph of principles only
-        principle_nodes = [n for n, d in self.graph.nodes(data=True) 
-                          if d.get('node_type') == 'principle'][:max_nodes]
-        
+    def domain_distribution_data(self) -> Tuple[List[Tuple[str, int]]]:
+        """Top 15 domains by node count"""
+        return (Counter(self._flat_domains).most_common(15),)
+    
+    def node_types_data(self) -> Tuple[Dict[str, int]]:
+        """Node counts per node type"""
+        return (dict(self.stats.get('node_types', {})),)
+    
+    def principle_network_data(self, max_nodes: int = 50) -> Optional[Tuple]:
+        """Nodes, edges, layout, colors and labels of the first max_nodes principles"""
+        principle_nodes = self._nodes_by_type.get('principle', [])[:max_nodes]
         subgraph = self.graph.subgraph(principle_nodes)
         
         if subgraph.number_of_nodes() == 0:
             print("⚠️  No principles found for visualization")
-            return
+            return None
         
-        # Create layout
-        fig, ax = plt.subplots(figsize=(16, 12))
+        nodes = list(subgraph.nodes())
+        edges = list(subgraph.edges())
         
-        # Use spring layout for better spacing
-        pos = nx.spring_layout(subgraph, k=2, iterations=50, seed=42)
+        # Force-directed layout for better spacing, cached between runs
+        pos = self._network_layout(subgraph)
         
-        # Draw nodes
-        node_colors = []
-        for node in subgraph.nodes():
-            data = self.graph.nodes[node]
-            domains = data.get('domains', [])
-            if isinstance(domains, str):
-                domains = domains.split(',')
-            # Color by primary domain
-            if 'contract' in domains:
-                node_colors.append('#FF6B6B')
-            elif 'criminal' in domains:
-                node_colors.append('#4ECDC4')
-            elif 'civil' in domains:
-                node_colors.append('#45B7D1')
-            else:
-                node_colors.append('#95E1D3')
+        # Colored by primary domain
+        other = len(PRINCIPLE_PALETTE) - 1
+        node_colors = [PRINCIPLE_PALETTE[self._color_index.get(node, other)] for node in nodes]
+        labels = {n: self.graph.nodes[n].get('name', '')[:15] for n in nodes}
         
-        nx.draw_networkx_nodes(subgraph, pos, 
-                              node_color=node_colors,
-                              node_size=800,
-                              alpha=0.9,
-                              ax=ax)
-        
-        # Draw edges
-        nx.draw_networkx_edges(subgraph, pos,
-                              edge_color='gray',
-                              alpha=0.5,
-                              arrows=True,
-                              arrowsize=15,
-                              width=1.5,
-                              ax=ax)
-        
-        # Draw labels
-        labels = {n: self.graph.nodes[n].get('name', '')[:15] for n in subgraph.nodes()}
-        nx.draw_networkx_labels(subgraph, pos, labels,
-                               font_size=8,
-                               font_weight='bold',
-                               ax=ax)
-        
-        # Add legend
-        legend_elements = [
-            mpatches.Patch(color='#FF6B6B', label='Contract Law'),
-            mpatches.Patch(color='#4ECDC4', label='Criminal Law'),
-            mpatches.Patch(color='#45B7D1', label='Civil Law'),
-            mpatches.Patch(color='#95E1D3', label='Other')
-        ]
-        ax.legend(handles=legend_elements, loc='upper right', fontsize=10)
-        
-        ax.set_title(f'SCMLex Hypergraph: Principle Network (Top {len(principle_nodes)} Principles)',
-                    fontsize=14, fontweight='bold', pad=20)
-        ax.axis('off')
-        
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        print(f"✅ Saved: {output_file}")
+        return nodes, edges, pos, node_colors, labels, len(principle_nodes)
     
-    def visualize_level_hierarchy(self, output_file: str):
-        """Create visualization showing Level 1 -> Level 2 hierarchy"""
-        print(f"\nCreating level hierarchy diagram...")
-        
+    def level_hierarchy_data(self) -> Optional[Tuple]:
+        """Level 1 and Level 2 nodes, their positions, derivation segments and labels"""
         # Get sample of Level 1 and Level 2 nodes
-        level1_nodes = [n for n, d in self.graph.nodes(data=True) 
-                       if d.get('level') == 1][:10]
+        level1_nodes = self._nodes_by_level.get(1, [])[:10]
         
         # Get Level 2 nodes connected to these Level 1 nodes
         level2_nodes = set()
         for l1_node in level1_nodes:
-            for _, target, data in self.graph.out_edges(l1_node, data=True):
-                if data.get('edge_type') == 'derivation':
-                    level2_nodes.add(target)
-                    if len(level2_nodes) >= 20:
-                        break
+            for target in self._derivations_from.get(l1_node, ()):
+                level2_nodes.add(target)
+                if len(level2_nodes) >= 20:
+                    break
+        level2_nodes = list(level2_nodes)
         
         # Create subgraph
-        all_nodes = level1_nodes + list(level2_nodes)
-        subgraph = self.graph.subgraph(all_nodes)
+        subgraph = self.graph.subgraph(level1_nodes + level2_nodes)
         
         if subgraph.number_of_nodes() == 0:
             print("⚠️  No hierarchy found for visualization")
-            return
-        
-        # Create hierarchical layout
-        fig, ax = plt.subplots(figsize=(16, 12))
+            return None
         
         # Manual positioning: Level 1 on top, Level 2 below
         pos = {}
@@ -228,129 +188,332 @@ class HypergraphVisualizer:
         for i, node in enumerate(level2_nodes):
             pos[node] = (i * (10 / max(l2_count, 1)), 0)
         
-        # Draw Level 1 nodes (principles)
-        nx.draw_networkx_nodes(subgraph, pos,
-                              nodelist=level1_nodes,
-                              node_color='#FF6B6B',
-                              node_size=1000,
-                              alpha=0.9,
-                              label='Level 1 Principles',
-                              ax=ax)
-        
-        # Draw Level 2 nodes (rules)
-        nx.draw_networkx_nodes(subgraph, pos,
-                              nodelist=list(level2_nodes),
-                              node_color='#4ECDC4',
-                              node_size=600,
-                              alpha=0.9,
-                              label='Level 2 Rules',
-                              ax=ax)
-        
-        # Draw derivation edges
-        derivation_edges = [(u, v) for u, v, d in subgraph.edges(data=True)
-                           if d.get('edge_type') == 'derivation']
-        nx.draw_networkx_edges(subgraph, pos,
-                              edgelist=derivation_edges,
-                              edge_color='green',
-                              alpha=0.6,
-                              arrows=True,
-                              arrowsize=15,
-                              width=2,
-                              ax=ax)
-        
-        # Draw labels
-        labels = {n: self.graph.nodes[n].get('name', '')[:12] for n in subgraph.nodes()}
-        nx.draw_networkx_labels(subgraph, pos, labels,
-                               font_size=7,
-                               font_weight='bold',
-                               ax=ax)
-        
-        ax.legend(loc='upper right', fontsize=12)
-        ax.set_title('SCMLex Hypergraph: Level 1 → Level 2 Derivation Hierarchy',
-                    fontsize=14, fontweight='bold', pad=20)
-        ax.axis('off')
-        
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        print(f"✅ Saved: {output_file}")
+        # Derivation edge endpoints as one (E, 2, 2) array, or None without edges
+        node_list = list(subgraph.nodes())
+        node_pos = {node: i for i, node in enumerate(node_list)}
+        edge_index = [(node_pos[u], node_pos[v])
+                      for u in node_list
+                      for v in self._derivations_from.get(u, ())
+                      if v in node_pos]
+        segments = None
+        if edge_index:
+            pos_arr = np.array([pos[node] for node in node_list], dtype=float)
+            segments = pos_arr[np.array(edge_index)]
+        
+        labels = {n: self.graph.nodes[n].get('name', '')[:12] for n in node_list}
+        
+        return level1_nodes, level2_nodes, pos, segments, labels
+    
+    def statistics_dashboard_data(self) -> Tuple[Dict[str, Any], np.ndarray]:
+        """Summary statistics and the number of nodes of each degree"""
+        degrees = np.fromiter((d for _, d in self.graph.degree()),
+                              dtype=np.int32, count=self.graph.number_of_nodes())
+        return dict(self.stats), np.bincount(degrees)
+    
+    def visualize_domain_distribution(self) -> Figure:
+        """Create bar chart of domain distribution"""
+        return plot_domain_distribution(*self.domain_distribution_data())
+    
+    def visualize_node_types(self) -> Figure:
+        """Create pie chart of node types"""
+        return plot_node_types(*self.node_types_data())
     
-    def create_statistics_dashboard(self, output_file: str):
+    def visualize_principle_network(self, max_nodes: int = 50) -> Optional[Figure]:
+        """Create network diagram of principles and their relationships"""
+        data = self.principle_network_data(max_nodes)
+        return plot_principle_network(*data) if data is not None else None
+    
+    def visualize_level_hierarchy(self) -> Optional[Figure]:
+        """Create visualization showing Level 1 -> Level 2 hierarchy"""
+        data = self.level_hierarchy_data()
+        return plot_level_hierarchy(*data) if data is not None else None
+    
+    def create_statistics_dashboard(self) -> Figure:
         """Create comprehensive statistics dashboard"""
-        print(f"\nCreating statistics dashboard...")
-        
-        fig = plt.figure(figsize=(16, 10))
-        gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
-        
-        # 1. Node types (pie chart)
-        ax1 = fig.add_subplot(gs[0, 0])
-        node_types = self.stats.get('node_types', {})
-        ax1.pie(node_types.values(), labels=node_types.keys(), autopct='%1.1f%%',
-               colors=['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A'])
-        ax1.set_title('Node Types', fontweight='bold')
-        
-        # 2. Top domains (bar chart)
-        ax2 = fig.add_subplot(gs[0, 1:])
-        top_domains = list(self.stats.get('top_domains', {}).items())[:8]
-        domains = [d[0] for d in top_domains]
-        counts = [d[1] for d in top_domains]
-        ax2.barh(domains, counts, color='steelblue')
-        ax2.set_xlabel('Count')
-        ax2.set_title('Top Legal Domains', fontweight='bold')
-        ax2.grid(axis='x', alpha=0.3)
-        
-        # 3. Edge types (bar chart)
-        ax3 = fig.add_subplot(gs[1, 0])
-        edge_types = self.stats.get('edge_types', {})
-        ax3.bar(edge_types.keys(), edge_types.values(), color='coral')
-        ax3.set_ylabel('Count')
-        ax3.set_title('Edge Types', fontweight='bold')
-        ax3.grid(axis='y', alpha=0.3)
-        
-        # 4. Level distribution
-        ax4 = fig.add_subplot(gs[1, 1])
-        levels = self.stats.get('levels', {})
-        ax4.bar([f'Level {k}' for k in levels.keys()], levels.values(), color='lightgreen')
-        ax4.set_ylabel('Count')
-        ax4.set_title('Level Distribution', fontweight='bold')
-        ax4.grid(axis='y', alpha=0.3)
-        
-        # 5. Key statistics (text)
-        ax5 = fig.add_subplot(gs[1, 2])
-        ax5.axis('off')
-        stats_text = f"""
+        return plot_statistics_dashboard(*self.statistics_dashboard_data())
+
+def plot_domain_distribution(top_domains: List[Tuple[str, int]]) -> Figure:
+    """Create bar chart of domain distribution from (domain, count) pairs"""
+    print(f"\nCreating domain distribution chart...")
+    
+    domains = [d[0] for d in top_domains]
+    counts = [d[1] for d in top_domains]
+    
+    # Create chart
+    fig, ax = plt.subplots(figsize=(12, 8))
+    bars = ax.barh(domains, counts, color='steelblue')
+    
+    # Add value labels
+    for i, (bar, count) in enumerate(zip(bars, counts)):
+        ax.text(count + 5, i, str(count), va='center', fontsize=10)
+    
+    ax.set_xlabel('Number of Nodes', fontsize=12)
+    ax.set_ylabel('Legal Domain', fontsize=12)
+    ax.set_title('SCMLex Hypergraph: Domain Distribution', fontsize=14, fontweight='bold')
+    ax.grid(axis='x', alpha=0.3)
+    
+    fig.tight_layout()
+    return fig
+
+def plot_node_types(node_types: Dict[str, int]) -> Figure:
+    """Create pie chart of node types"""
+    print(f"\nCreating node types chart...")
+    
+    # Create pie chart
+    fig, ax = plt.subplots(figsize=(10, 8))
+    
+    colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']
+    explode = [0.05 if v == max(node_types.values()) else 0 for v in node_types.values()]
+    
+    wedges, texts, autotexts = ax.pie(
+        node_types.values(),
+        labels=node_types.keys(),
+        autopct='%1.1f%%',
+        colors=colors,
+        explode=explode,
+        startangle=90,
+        textprops={'fontsize': 12}
+    )
+    
+    # Add count labels
+    for i, (label, count) in enumerate(node_types.items()):
+        texts[i].set_text(f'{label.capitalize()}\n({count})')
+    
+    ax.set_title('SCMLex Hypergraph: Node Type Distribution', 
+                fontsize=14, fontweight='bold', pad=20)
+    
+    fig.tight_layout()
+    return fig
+
+def plot_principle_network(nodes: List[str], edges: List[Tuple[str, str]],
+                           pos: Dict[str, Tuple[float, float]], node_colors: List[str],
+                           labels: Dict[str, str], principle_count: int) -> Figure:
+    """Create network diagram of principles and their relationships"""
+    print(f"\nCreating principle network diagram...")
+    
+    # Attribute-free copy of the principle subgraph for networkx to draw
+    subgraph = nx.MultiDiGraph()
+    subgraph.add_nodes_from(nodes)
+    subgraph.add_edges_from(edges)
+    
+    fig, ax = plt.subplots(figsize=(16, 12))
+    
+    # Rasterize the node and edge artists (networkx draws them at zorder
+    # 2 and 1); labels and the legend stay vector in PDF/SVG output.
+    # Directed edges are individual arrow patches, which only honour
+    # rasterization through the axes zorder threshold.
+    ax.set_rasterization_zorder(3)
+    
+    # Draw nodes, colored by primary domain
+    nx.draw_networkx_nodes(subgraph, pos, 
+                          node_color=node_colors,
+                          node_size=800,
+                          alpha=0.9,
+                          edgecolors='none',
+                          ax=ax)
+    
+    # Draw edges
+    nx.draw_networkx_edges(subgraph, pos,
+                          edge_color='gray',
+                          alpha=0.5,
+                          arrows=True,
+                          arrowsize=15,
+                          width=1.5,
+                          ax=ax)
+    
+    # Draw labels
+    nx.draw_networkx_labels(subgraph, pos, labels,
+                           font_size=8,
+                           font_weight='bold',
+                           ax=ax)
+    
+    # Add legend
+    legend_elements = [
+        mpatches.Patch(color='#FF6B6B', label='Contract Law'),
+        mpatches.Patch(color='#4ECDC4', label='Criminal Law'),
+        mpatches.Patch(color='#45B7D1', label='Civil Law'),
+        mpatches.Patch(color='#95E1D3', label='Other')
+    ]
+    ax.legend(handles=legend_elements, loc='upper right', fontsize=10)
+    
+    ax.set_title(f'SCMLex Hypergraph: Principle Network (Top {principle_count} Principles)',
+                fontsize=14, fontweight='bold', pad=20)
+    ax.axis('off')
+    
+    fig.tight_layout()
+    return fig
+
+def plot_level_hierarchy(level1_nodes: List[str], level2_nodes: List[str],
+                         pos: Dict[str, Tuple[float, float]], segments: Optional[np.ndarray],
+                         labels: Dict[str, str]) -> Figure:
+    """Create visualization showing Level 1 -> Level 2 hierarchy"""
+    print(f"\nCreating level hierarchy diagram...")
+    
+    # Node-only graph for networkx to draw; edges are drawn from segments below
+    graph = nx.DiGraph()
+    graph.add_nodes_from(pos)
+    
+    # Create hierarchical layout
+    fig, ax = plt.subplots(figsize=(16, 12))
+    
+    # Rasterize nodes and edges as in the principle network
+    ax.set_rasterization_zorder(3)
+    
+    # Draw Level 1 nodes (principles)
+    nx.draw_networkx_nodes(graph, pos,
+                          nodelist=level1_nodes,
+                          node_color='#FF6B6B',
+                          node_size=1000,
+                          alpha=0.9,
+                          edgecolors='none',
+                          label='Level 1 Principles',
+                          ax=ax)
+    
+    # Draw Level 2 nodes (rules)
+    nx.draw_networkx_nodes(graph, pos,
+                          nodelist=level2_nodes,
+                          node_color='#4ECDC4',
+                          node_size=600,
+                          alpha=0.9,
+                          edgecolors='none',
+                          label='Level 2 Rules',
+                          ax=ax)
+    
+    # Draw derivation edges as a single LineCollection, with their
+    # direction shown by one quiver call of short arrowheads
+    if segments is not None:
+        ax.add_collection(LineCollection(segments, colors='green', linewidths=2,
+                                         alpha=0.6, zorder=1))
+        # Heads sit three quarters of the way along each edge, clear of the
+        # target node, and have a fixed size whatever the edge length
+        direction = segments[:, 1] - segments[:, 0]
+        length = np.hypot(direction[:, 0], direction[:, 1])
+        length[length == 0] = 1
+        tips = segments[:, 0] + 0.75 * direction
+        ax.quiver(tips[:, 0], tips[:, 1], direction[:, 0] / length, direction[:, 1] / length,
+                  angles='xy', scale_units='inches', scale=5, pivot='tip',
+                  units='inches', width=0.03, headwidth=5, headlength=6, headaxislength=5,
+                  color='green', alpha=0.6, zorder=1)
+        # Pad the view by 5% around the edges, as draw_networkx_edges does
+        points = segments.reshape(-1, 2)
+        lo, hi = points.min(axis=0), points.max(axis=0)
+        pad = 0.05 * (hi - lo)
+        ax.update_datalim([lo - pad, hi + pad])
+        ax.autoscale_view()
+    
+    # Draw labels
+    nx.draw_networkx_labels(graph, pos, labels,
+                           font_size=7,
+                           font_weight='bold',
+                           ax=ax)
+    
+    ax.legend(loc='upper right', fontsize=12)
+    ax.set_title('SCMLex Hypergraph: Level 1 → Level 2 Derivation Hierarchy',
+                fontsize=14, fontweight='bold', pad=20)
+    ax.axis('off')
+    
+    fig.tight_layout()
+    return fig
+
+def plot_statistics_dashboard(stats: Dict[str, Any], degree_counts: np.ndarray) -> Figure:
+    """Create comprehensive statistics dashboard
+    
+    degree_counts[d] is the number of nodes with degree d, as from np.bincount.
+    """
+    print(f"\nCreating statistics dashboard...")
+    
+    fig = plt.figure(figsize=(16, 10))
+    gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
+    
+    # 1. Node types (pie chart)
+    ax1 = fig.add_subplot(gs[0, 0])
+    node_types = stats.get('node_types', {})
+    ax1.pie(node_types.values(), labels=node_types.keys(), autopct='%1.1f%%',
+           colors=['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A'])
+    ax1.set_title('Node Types', fontweight='bold')
+    
+    # 2. Top domains (bar chart)
+    ax2 = fig.add_subplot(gs[0, 1:])
+    top_domains = list(stats.get('top_domains', {}).items())[:8]
+    domains = [d[0] for d in top_domains]
+    counts = [d[1] for d in top_domains]
+    ax2.barh(domains, counts, color='steelblue')
+    ax2.set_xlabel('Count')
+    ax2.set_title('Top Legal Domains', fontweight='bold')
+    ax2.grid(axis='x', alpha=0.3)
+    
+    # 3. Edge types (bar chart)
+    ax3 = fig.add_subplot(gs[1, 0])
+    edge_types = stats.get('edge_types', {})
+    ax3.bar(edge_types.keys(), edge_types.values(), color='coral')
+    ax3.set_ylabel('Count')
+    ax3.set_title('Edge Types', fontweight='bold')
+    ax3.grid(axis='y', alpha=0.3)
+    
+    # 4. Level distribution
+    ax4 = fig.add_subplot(gs[1, 1])
+    levels = stats.get('levels', {})
+    ax4.bar([f'Level {k}' for k in levels.keys()], levels.values(), color='lightgreen')
+    ax4.set_ylabel('Count')
+    ax4.set_title('Level Distribution', fontweight='bold')
+    ax4.grid(axis='y', alpha=0.3)
+    
+    # 5. Key statistics (text)
+    ax5 = fig.add_subplot(gs[1, 2])
+    ax5.axis('off')
+    stats_text = f"""
         KEY STATISTICS
         
-        Total Nodes: {self.stats.get('total_nodes', 0):,}
-        Total Edges: {self.stats.get('total_edges', 0):,}
-        Total Hyperedges: {self.stats.get('total_hyperedges', 0):,}
+        Total Nodes: {stats.get('total_nodes', 0):,}
+        Total Edges: {stats.get('total_edges', 0):,}
+        Total Hyperedges: {stats.get('total_hyperedges', 0):,}
         
-        Average Degree: {self.stats.get('average_degree', 0):.2f}
-        Graph Density: {self.stats.get('density', 0):.6f}
+        Average Degree: {stats.get('average_degree', 0):.2f}
+        Graph Density: {stats.get('density', 0):.6f}
         
-        Connected: {self.stats.get('is_connected', False)}
+        Connected: {stats.get('is_connected', False)}
         """
-        ax5.text(0.1, 0.5, stats_text, fontsize=11, family='monospace',
-                verticalalignment='center')
-        
-        # 6. Degree distribution (if available)
-        ax6 = fig.add_subplot(gs[2, :])
-        degrees = [d for n, d in self.graph.degree()]
-        if degrees:
-            ax6.hist(degrees, bins=30, color='purple', alpha=0.7, edgecolor='black')
-            ax6.set_xlabel('Node Degree')
-            ax6.set_ylabel('Frequency')
-            ax6.set_title('Degree Distribution', fontweight='bold')
-            ax6.grid(axis='y', alpha=0.3)
-        
-        fig.suptitle('SCMLex Hypergraph: Statistics Dashboard', 
-                    fontsize=16, fontweight='bold', y=0.98)
-        
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        print(f"✅ Saved: {output_file}")
+    ax5.text(0.1, 0.5, stats_text, fontsize=11, family='monospace',
+            verticalalignment='center')
+    
+    # 6. Degree distribution (if available)
+    ax6 = fig.add_subplot(gs[2, :])
+    if degree_counts.size:
+        # Bin the distinct degree values weighted by their counts rather
+        # than handing matplotlib one sample per node
+        observed = np.flatnonzero(degree_counts)
+        ax6.hist(observed, bins=30, weights=degree_counts[observed],
+                 color='purple', alpha=0.7, edgecolor='black')
+        ax6.set_xlabel('Node Degree')
+        ax6.set_ylabel('Frequency')
+        ax6.set_title('Degree Distribution', fontweight='bold')
+        ax6.grid(axis='y', alpha=0.3)
+    
+    fig.suptitle('SCMLex Hypergraph: Statistics Dashboard', 
+                fontsize=16, fontweight='bold', y=0.98)
+    
+    return fig
+
+def save_figure(fig: Figure, output_file: str, dpi: int = 300):
+    """Write a figure to output_file and release it"""
+    fig.savefig(output_file, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    print(f"✅ Saved: {output_file}")
+
+# (data method, plot function, output file, dpi) for each figure produced by main().
+# The dashboard's small bar charts and histogram gain nothing visible from
+# 300 dpi, so it alone is saved at 150.
+VISUALIZATIONS = [
+    ('domain_distribution_data', plot_domain_distribution, 'domain_distribution.png', 300),
+    ('node_types_data', plot_node_types, 'node_types.png', 300),
+    ('principle_network_data', plot_principle_network, 'principle_network.png', 300),
+    ('level_hierarchy_data', plot_level_hierarchy, 'level_hierarchy.png', 300),
+    ('statistics_dashboard_data', plot_statistics_dashboard, 'statistics_dashboard.png', 150),
+]
+
+def _render(plot, args: Tuple, output_file: str, dpi: int):
+    """Draw and save one figure from its prepared inputs, in a worker process"""
+    save_figure(plot(*args), output_file, dpi)
 
 def main():
     """Generate all visualizations"""
@@ -361,17 +524,28 @@ def main():
     
     output_dir.mkdir(exist_ok=True)
     
+    # Load the graph once and reduce it to the small inputs each figure needs
     viz = HypergraphVisualizer(hypergraph_file)
     
     print("\n" + "="*60)
     print("GENERATING VISUALIZATIONS")
     print("="*60)
     
-    viz.visualize_domain_distribution(str(output_dir / "domain_distribution.png"))
-    viz.visualize_node_types(str(output_dir / "node_types.png"))
-    viz.visualize_principle_network(str(output_dir / "principle_network.png"))
-    viz.visualize_level_hierarchy(str(output_dir / "level_hierarchy.png"))
-    viz.create_statistics_dashboard(str(output_dir / "statistics_dashboard.png"))
+    tasks = []
+    for data_method, plot, filename, dpi in VISUALIZATIONS:
+        args = getattr(viz, data_method)()
+        if args is not None:
+            tasks.append((plot, args, str(output_dir / filename), dpi))
+    
+    # Each figure is independent and dominated by rendering and PNG encoding,
+    # so draw them in separate processes. Spawned workers start without a
+    # copy of the parent's graph and receive only their figure's inputs.
+    max_workers = min(len(tasks), os.cpu_count() or 1) or 1
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = [executor.submit(_render, *task) for task in tasks]
+        for future in futures:
+            future.result()
     
     print("\n" + "="*60)
     print(f"✅ All visualizations saved to: {output_dir}")
@@ -379,4 +553,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-